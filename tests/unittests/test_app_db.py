@@ -0,0 +1,201 @@
+# ABOUTME: Tests for the app-layer SQLite connection helpers.
+# ABOUTME: Verifies connection pooling and cursor-to-dict conversion.
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from unbounddb.app.db import (
+    ConnectionPool,
+    fetchall_column,
+    fetchall_to_columns,
+    fetchall_to_dicts,
+    get_connection,
+)
+
+
+@pytest.fixture
+def simple_db(tmp_path: Path) -> Path:
+    """Create a small database with one table."""
+    db_path = tmp_path / "test.sqlite"
+    conn = sqlite3.connect(str(db_path))
+    conn.execute("CREATE TABLE items (name TEXT, value INTEGER)")
+    conn.executemany("INSERT INTO items VALUES (?, ?)", [("a", 1), ("b", 2)])
+    conn.commit()
+    conn.close()
+    return db_path
+
+
+class TestGetConnection:
+    """Tests for opening database connections."""
+
+    def test_read_only_connection_rejects_writes(self, simple_db: Path) -> None:
+        conn = get_connection(simple_db, read_only=True)
+        assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 2
+        with pytest.raises(sqlite3.OperationalError, match="readonly"):
+            conn.execute("INSERT INTO items VALUES ('c', 3)")
+        conn.close()
+
+    def test_read_only_connection_is_tuned_for_reads(self, simple_db: Path) -> None:
+        conn = get_connection(simple_db, read_only=True)
+        assert conn.execute("PRAGMA query_only").fetchone()[0] == 1
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == -16384
+        conn.close()
+
+    def test_writable_connection_keeps_defaults(self, simple_db: Path) -> None:
+        conn = get_connection(simple_db)
+        assert conn.execute("PRAGMA query_only").fetchone()[0] == 0
+        conn.close()
+
+    def test_read_only_path_with_special_characters(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "my db#1.sqlite"
+        sqlite3.connect(str(db_path)).close()
+        conn = get_connection(db_path, read_only=True)
+        assert conn.execute("SELECT 1").fetchone()[0] == 1
+        conn.close()
+
+    def test_missing_database_raises(self, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            get_connection(tmp_path / "missing.sqlite")
+
+
+class TestConnectionPool:
+    """Tests for ConnectionPool borrowing and reuse."""
+
+    def test_reuses_returned_connection(self, simple_db: Path) -> None:
+        pool = ConnectionPool(simple_db)
+        with pool.connection() as first:
+            pass
+        with pool.connection() as second:
+            pass
+        assert first is second
+
+    def test_nested_borrows_get_distinct_connections(self, simple_db: Path) -> None:
+        pool = ConnectionPool(simple_db)
+        with pool.connection() as outer, pool.connection() as inner:
+            assert outer is not inner
+            assert inner.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 2
+
+    def test_closes_connections_beyond_max_size(self, simple_db: Path) -> None:
+        pool = ConnectionPool(simple_db, max_size=1)
+        # Inner is released first and fills the pool; outer is closed on release
+        with pool.connection() as outer, pool.connection() as inner:
+            pass
+        with pool.connection() as reused:
+            assert reused is inner
+        with pytest.raises(sqlite3.ProgrammingError):
+            outer.execute("SELECT 1")
+
+    def test_missing_database_raises(self, tmp_path: Path) -> None:
+        pool = ConnectionPool(tmp_path / "missing.sqlite")
+        with pytest.raises(FileNotFoundError), pool.connection():
+            pass
+
+    def test_pooled_connections_are_read_only(self, simple_db: Path) -> None:
+        pool = ConnectionPool(simple_db)
+        with pool.connection() as conn, pytest.raises(sqlite3.OperationalError):
+            conn.execute("DELETE FROM items")
+
+    def test_close_closes_idle_connections(self, simple_db: Path) -> None:
+        pool = ConnectionPool(simple_db)
+        with pool.connection() as conn:
+            pass
+        pool.close()
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+    def test_close_closes_borrowed_connection_on_return(self, simple_db: Path) -> None:
+        pool = ConnectionPool(simple_db)
+        with pool.connection() as conn:
+            pool.close()
+            conn.execute("SELECT 1")
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+    def test_rolls_back_open_transaction_on_release(self, simple_db: Path) -> None:
+        pool = ConnectionPool(simple_db, read_only=False)
+        with pool.connection() as conn:
+            conn.execute("INSERT INTO items VALUES ('c', 3)")
+            assert conn.in_transaction
+        with pool.connection() as reused:
+            assert reused is conn
+            assert not reused.in_transaction
+            assert reused.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 2
+
+    def test_returns_connection_when_block_raises(self, simple_db: Path) -> None:
+        pool = ConnectionPool(simple_db)
+        with pytest.raises(sqlite3.OperationalError), pool.connection() as conn:
+            conn.execute("SELECT * FROM missing_table")
+        with pool.connection() as reused:
+            assert reused is conn
+
+    def test_discards_connection_closed_by_borrower(self, simple_db: Path) -> None:
+        pool = ConnectionPool(simple_db)
+        with pool.connection() as conn:
+            conn.close()
+        with pool.connection() as fresh:
+            assert fresh is not conn
+            assert fresh.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 2
+
+    def test_warm_leaves_a_pooled_connection(self, simple_db: Path) -> None:
+        pool = ConnectionPool(simple_db)
+        pool.warm(["items", "missing_table"])
+        with pool.connection() as conn:
+            assert not conn.in_transaction
+        with pool.connection() as first, pool.connection() as second:
+            assert first is conn
+            assert second is not conn
+
+    def test_warm_ignores_missing_database(self, tmp_path: Path) -> None:
+        pool = ConnectionPool(tmp_path / "missing.sqlite")
+        pool.warm(["items"])
+
+
+class TestFetchallToDicts:
+    """Tests for fetchall_to_dicts conversion."""
+
+    def test_rows_become_dicts(self, simple_db: Path) -> None:
+        pool = ConnectionPool(simple_db)
+        with pool.connection() as conn:
+            rows = fetchall_to_dicts(conn.execute("SELECT name, value FROM items ORDER BY name"))
+        assert rows == [{"name": "a", "value": 1}, {"name": "b", "value": 2}]
+
+    def test_empty_result(self, simple_db: Path) -> None:
+        pool = ConnectionPool(simple_db)
+        with pool.connection() as conn:
+            rows = fetchall_to_dicts(conn.execute("SELECT name FROM items WHERE value > 10"))
+        assert rows == []
+
+
+class TestFetchallColumn:
+    """Tests for fetchall_column conversion."""
+
+    def test_returns_values_in_order(self, simple_db: Path) -> None:
+        pool = ConnectionPool(simple_db)
+        with pool.connection() as conn:
+            values = fetchall_column(conn.execute("SELECT name FROM items ORDER BY name"))
+        assert values == ["a", "b"]
+
+    def test_empty_result(self, simple_db: Path) -> None:
+        pool = ConnectionPool(simple_db)
+        with pool.connection() as conn:
+            values = fetchall_column(conn.execute("SELECT name FROM items WHERE value > 10"))
+        assert values == []
+
+
+class TestFetchallToColumns:
+    """Tests for fetchall_to_columns conversion."""
+
+    def test_rows_become_column_lists(self, simple_db: Path) -> None:
+        pool = ConnectionPool(simple_db)
+        with pool.connection() as conn:
+            columns = fetchall_to_columns(conn.execute("SELECT name, value FROM items ORDER BY name"))
+        assert columns == {"name": ["a", "b"], "value": [1, 2]}
+
+    def test_empty_result_keeps_column_names(self, simple_db: Path) -> None:
+        pool = ConnectionPool(simple_db)
+        with pool.connection() as conn:
+            columns = fetchall_to_columns(conn.execute("SELECT name, value FROM items WHERE value > 10"))
+        assert columns == {"name": [], "value": []}
@@ -0,0 +1,111 @@
+# ABOUTME: Unit tests for the battle query functions.
+# ABOUTME: Tests battle team lookups, team moves with the Status filter, and best-move detail.
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from unbounddb.app.queries import get_battle_by_id, get_battle_with_team
+from unbounddb.app.tools.defensive_suggester import get_battle_pokemon_with_moves, get_neutralized_pokemon_detail
+from unbounddb.app.tools.offensive_suggester import get_battle_pokemon_types
+
+
+@pytest.fixture
+def battle_db(tmp_path: Path) -> Path:
+    """Create a test database with one battle, its team, and an empty battle."""
+    db_path = tmp_path / "test.sqlite"
+    conn = sqlite3.connect(str(db_path))
+    conn.execute("CREATE TABLE battles (battle_id INTEGER, name VARCHAR, difficulty VARCHAR)")
+    conn.execute("CREATE TABLE battle_pokemon (id INTEGER, battle_id INTEGER, pokemon_key VARCHAR, slot INTEGER)")
+    conn.execute("CREATE TABLE pokemon (pokemon_key VARCHAR, type1 VARCHAR, type2 VARCHAR)")
+    conn.execute("INSERT INTO battles VALUES (1, 'Leader Mirskle', 'Insane'), (2, 'Empty Trainer', NULL)")
+    conn.execute("INSERT INTO battle_pokemon VALUES (10, 1, 'venusaur', 2), (11, 1, 'shiinotic', 1)")
+    conn.execute("INSERT INTO pokemon VALUES ('venusaur', 'Grass', 'Poison'), ('shiinotic', 'Grass', 'Fairy')")
+    conn.execute("CREATE TABLE battle_pokemon_moves (battle_pokemon_id INTEGER, move_key VARCHAR, slot INTEGER)")
+    conn.execute("CREATE TABLE moves (move_key VARCHAR, name VARCHAR, type VARCHAR, category VARCHAR)")
+    conn.execute(
+        "INSERT INTO battle_pokemon_moves VALUES (10, 'sludge_bomb', 1), (10, 'sleep_powder', 2), (11, 'moonblast', 1)"
+    )
+    conn.execute(
+        "INSERT INTO moves VALUES ('sludge_bomb', 'Sludge Bomb', 'Poison', 'Special'), "
+        "('sleep_powder', 'Sleep Powder', 'Grass', 'Status'), ('moonblast', 'Moonblast', 'Fairy', 'Special')"
+    )
+    conn.commit()
+    conn.close()
+    return db_path
+
+
+class TestGetBattleWithTeam:
+    """Tests for get_battle_with_team."""
+
+    def test_returns_battle_and_team_in_slot_order(self, battle_db: Path) -> None:
+        result = get_battle_with_team(1, battle_db)
+
+        assert result is not None
+        assert result["battle"] == {"battle_id": 1, "name": "Leader Mirskle", "difficulty": "Insane"}
+        assert [p["pokemon_key"] for p in result["team"]] == ["shiinotic", "venusaur"]
+
+    def test_matches_separate_lookups(self, battle_db: Path) -> None:
+        result = get_battle_with_team(1, battle_db)
+
+        assert result is not None
+        assert result["battle"] == get_battle_by_id(1, battle_db)
+        assert result["team"] == get_battle_pokemon_types(1, battle_db)
+
+    def test_sorts_team_inserted_out_of_slot_order(self, battle_db: Path) -> None:
+        conn = sqlite3.connect(str(battle_db))
+        conn.execute("INSERT INTO battles VALUES (3, 'Shuffled Trainer', NULL)")
+        conn.execute(
+            "INSERT INTO battle_pokemon VALUES (20, 3, 'venusaur', 4), (21, 3, 'shiinotic', 2), "
+            "(22, 3, 'venusaur', 3), (23, 3, 'shiinotic', 1)"
+        )
+        conn.commit()
+        conn.close()
+
+        result = get_battle_with_team(3, battle_db)
+
+        assert result is not None
+        assert [p["slot"] for p in result["team"]] == [1, 2, 3, 4]
+
+    def test_battle_without_team(self, battle_db: Path) -> None:
+        result = get_battle_with_team(2, battle_db)
+
+        assert result == {"battle": {"battle_id": 2, "name": "Empty Trainer", "difficulty": None}, "team": []}
+
+    def test_unknown_battle_returns_none(self, battle_db: Path) -> None:
+        assert get_battle_with_team(99, battle_db) is None
+
+
+class TestGetBattlePokemonWithMoves:
+    """Tests for get_battle_pokemon_with_moves."""
+
+    def test_excludes_status_moves_by_default(self, battle_db: Path) -> None:
+        result = get_battle_pokemon_with_moves(1, battle_db)
+
+        assert [(r["slot"], r["move_key"]) for r in result] == [(1, "moonblast"), (2, "sludge_bomb")]
+
+    def test_include_status_returns_all_moves(self, battle_db: Path) -> None:
+        result = get_battle_pokemon_with_moves(1, battle_db, include_status=True)
+
+        assert [r["move_key"] for r in result] == ["moonblast", "sludge_bomb", "sleep_powder"]
+        assert result[2]["move_category"] == "Status"
+
+
+class TestGetNeutralizedPokemonDetail:
+    """Tests for get_neutralized_pokemon_detail."""
+
+    def test_best_move_per_slot(self, battle_db: Path) -> None:
+        result = get_neutralized_pokemon_detail(1, "Steel", None, battle_db)
+
+        assert [(r["slot"], r["best_move"], r["best_effectiveness"]) for r in result] == [
+            (1, "Moonblast", 0.5),
+            (2, "Sludge Bomb", 0.0),
+        ]
+        assert all(r["is_neutralized"] for r in result)
+
+    def test_super_effective_move_not_neutralized(self, battle_db: Path) -> None:
+        result = get_neutralized_pokemon_detail(1, "Dragon", None, battle_db)
+
+        assert result[0]["best_effectiveness"] == 2.0
+        assert result[0]["is_neutralized"] is False
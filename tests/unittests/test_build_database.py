@@ -0,0 +1,109 @@
+# ABOUTME: Tests for build-time SQLite database helpers.
+# ABOUTME: Verifies index creation, index use by app lookups, and read-only connections.
+
+import sqlite3
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from unbounddb.app.location_filters import LocationFilterConfig
+from unbounddb.app.queries import _AVAILABLE_POKEMON_QUERY
+from unbounddb.build.database import create_indexes, get_connection
+
+
+@pytest.fixture
+def indexed_conn(tmp_path: Path) -> Iterator[sqlite3.Connection]:
+    """Create a small database with the indexed tables and run create_indexes."""
+    conn = sqlite3.connect(str(tmp_path / "test.sqlite"))
+    conn.execute(
+        "CREATE TABLE evolutions (from_pokemon TEXT, to_pokemon TEXT, method TEXT, condition TEXT, "
+        "from_pokemon_key TEXT, to_pokemon_key TEXT)"
+    )
+    conn.execute(
+        "CREATE TABLE locations (pokemon TEXT, pokemon_key TEXT, location_name TEXT, "
+        "encounter_method TEXT, encounter_notes TEXT, requirement TEXT)"
+    )
+    conn.execute("INSERT INTO locations VALUES ('Mon0', 'mon0', 'Route 1', 'grass', '', '')")
+    conn.execute("CREATE TABLE moves (name TEXT, move_key TEXT, type TEXT, category TEXT)")
+    conn.execute("CREATE TABLE pokemon_moves (pokemon_key TEXT, move_key TEXT, learn_method TEXT, level INTEGER)")
+    conn.execute("CREATE TABLE battle_pokemon (id INTEGER, battle_id INTEGER, pokemon_key TEXT, slot INTEGER)")
+    conn.executemany(
+        "INSERT INTO evolutions VALUES (?, ?, 'Level', ?, ?, ?)",
+        [(f"Mon{i}", f"Mon{i + 1}", str(i), f"mon{i}", f"mon{i + 1}") for i in range(200)],
+    )
+    create_indexes(conn)
+    yield conn
+    conn.close()
+
+
+def _index_names(conn: sqlite3.Connection) -> set[str]:
+    return {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+
+
+class TestCreateIndexes:
+    """Tests for create_indexes."""
+
+    def test_creates_lower_name_indexes(self, indexed_conn: sqlite3.Connection) -> None:
+        assert {
+            "idx_evolutions_from_pokemon_lower",
+            "idx_evolutions_to_pokemon_lower",
+            "idx_locations_pokemon_lower",
+        } <= _index_names(indexed_conn)
+
+    def test_creates_catalog_indexes(self, indexed_conn: sqlite3.Connection) -> None:
+        assert {"idx_moves_name", "idx_moves_type", "idx_moves_category"} <= _index_names(indexed_conn)
+
+    def test_creates_covering_move_learner_index(self, indexed_conn: sqlite3.Connection) -> None:
+        assert "idx_pokemon_moves_move_key_pokemon_key" in _index_names(indexed_conn)
+
+    def test_move_learner_lookup_uses_covering_index(self, indexed_conn: sqlite3.Connection) -> None:
+        plan = indexed_conn.execute(
+            "EXPLAIN QUERY PLAN SELECT pokemon_key FROM pokemon_moves WHERE move_key = ?", ["tackle"]
+        ).fetchall()
+        assert any("COVERING INDEX idx_pokemon_moves_move_key_pokemon_key" in row[3] for row in plan)
+
+    def test_battle_team_lookup_skips_sort(self, indexed_conn: sqlite3.Connection) -> None:
+        plan = indexed_conn.execute(
+            "EXPLAIN QUERY PLAN SELECT pokemon_key FROM battle_pokemon WHERE battle_id = ? ORDER BY slot", [1]
+        ).fetchall()
+        assert any("idx_battle_pokemon_battle_id_slot" in row[3] for row in plan)
+        assert not any("TEMP B-TREE" in row[3] for row in plan)
+
+    def test_leaves_no_planner_statistics(self, indexed_conn: sqlite3.Connection) -> None:
+        assert "sqlite_stat1" not in {
+            row[0] for row in indexed_conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        }
+
+    def test_skips_missing_tables(self, indexed_conn: sqlite3.Connection) -> None:
+        assert not any(name.startswith("idx_battles_") for name in _index_names(indexed_conn))
+
+    def test_evolution_walk_uses_lower_index(self, indexed_conn: sqlite3.Connection) -> None:
+        plan = indexed_conn.execute(
+            f"EXPLAIN QUERY PLAN {_AVAILABLE_POKEMON_QUERY}",
+            {**LocationFilterConfig(has_surf=False).sql_params(), "level_cap": None},
+        ).fetchall()
+        assert any("idx_evolutions_from_pokemon_lower" in row[3] for row in plan)
+
+
+class TestGetConnection:
+    """Tests for opening an existing built database."""
+
+    def test_read_only_rejects_writes(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "test.sqlite"
+        sqlite3.connect(str(db_path)).close()
+        conn = get_connection(db_path, read_only=True)
+        with pytest.raises(sqlite3.OperationalError, match="readonly"):
+            conn.execute("CREATE TABLE t (x INTEGER)")
+        conn.close()
+
+    def test_default_connection_is_writable(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "test.sqlite"
+        sqlite3.connect(str(db_path)).close()
+        conn = get_connection(db_path)
+        conn.execute("CREATE TABLE t (x INTEGER)")
+        conn.close()
+
+    def test_missing_database_raises(self, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            get_connection(tmp_path / "missing.sqlite", read_only=True)
@@ -4,7 +4,13 @@
 import polars as pl
 import pytest
 
+from unbounddb.app.tools.defensive_suggester import (
+    _build_pokemon_move_types,
+    _count_neutralized_pokemon,
+    _score_all_type_combinations,
+)
 from unbounddb.utils.type_chart import (
+    TYPE_INDEX,
     TYPES,
     generate_all_type_combinations,
     get_effectiveness,
@@ -146,6 +152,35 @@ class TestNeutralizationLogic:
         all_neutralized = all(get_effectiveness(mt, def_type1, def_type2) <= 1.0 for mt in move_types)
         assert all_neutralized is False
 
+    def test_build_move_types_dedups_per_slot(self) -> None:
+        """Each slot keeps its unique move types as TYPE_INDEX positions."""
+        rows = [
+            {"slot": 1, "move_type": "Fire", "move_category": "Special"},
+            {"slot": 1, "move_type": "Fire", "move_category": "Physical"},
+            {"slot": 2, "move_type": "Electric", "move_category": "Special"},
+        ]
+        result = _build_pokemon_move_types(rows)
+        assert result == {1: (TYPE_INDEX["Fire"],), 2: (TYPE_INDEX["Electric"],)}
+
+    def test_count_neutralized_uses_move_type_indexes(self) -> None:
+        """Only Pokemon without a super-effective move count against a Water defender."""
+        fire_normal = (TYPE_INDEX["Fire"], TYPE_INDEX["Normal"])
+        fire_electric = (TYPE_INDEX["Fire"], TYPE_INDEX["Electric"])
+        assert _count_neutralized_pokemon([fire_normal, fire_electric], "Water", None) == 1
+
+
+class TestScoreAllTypeCombinations:
+    """Tests for the ranking of all 171 typings against one team."""
+
+    def test_ranks_all_combinations_by_score(self) -> None:
+        """All 171 typings are scored and sorted by score DESC."""
+        move_indexes = [(TYPE_INDEX["Fire"], TYPE_INDEX["Normal"])]
+        results = _score_all_type_combinations(["Fire", "Normal"], move_indexes)
+
+        assert len(results) == 171
+        scores = [r["score"] for r in results]
+        assert scores == sorted(scores, reverse=True)
+
 
 class TestEmptyInputHandling:
     """Tests for handling empty inputs gracefully."""
@@ -1,18 +1,24 @@
 # ABOUTME: Unit tests for the location query functions and filter logic.
 # ABOUTME: Tests location search, Pokemon lookup, and filter application.
 
+import os
 import sqlite3
+from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
 
-from unbounddb.app.location_filters import LocationFilterConfig, apply_location_filters
+from unbounddb.app import queries
+from unbounddb.app.location_filters import LOCATION_FILTER_SQL, LocationFilterConfig, apply_location_filters
 from unbounddb.app.queries import (
     get_all_evolutions,
+    get_all_location_names,
     get_all_pokemon_names_from_locations,
     get_available_pokemon_set,
     get_first_blocked_evolution,
     get_pre_evolutions,
+    invalidate_query_caches,
+    refresh_query_caches_if_rebuilt,
     search_pokemon_locations,
 )
 
@@ -381,6 +387,99 @@ class TestApplyLocationFiltersEmptyInput:
         assert result == []
 
 
+class TestLocationFilterConfigIsPassthrough:
+    """Tests for LocationFilterConfig.is_passthrough."""
+
+    def test_default_config_is_passthrough(self) -> None:
+        """Default config keeps every location row."""
+        assert LocationFilterConfig().is_passthrough()
+
+    def test_level_cap_and_hms_do_not_affect_passthrough(self) -> None:
+        """level_cap and available_hms do not filter location rows."""
+        config = LocationFilterConfig(level_cap=20, available_hms=frozenset({"Surf"}))
+        assert config.is_passthrough()
+
+    @pytest.mark.parametrize(
+        "config",
+        [
+            LocationFilterConfig(has_surf=False),
+            LocationFilterConfig(has_dive=False),
+            LocationFilterConfig(rod_level="Good Rod"),
+            LocationFilterConfig(has_rock_smash=False),
+            LocationFilterConfig(post_game=False),
+            LocationFilterConfig(accessible_locations=("Route 1",)),
+        ],
+    )
+    def test_any_row_filter_disables_passthrough(self, config: LocationFilterConfig) -> None:
+        """Any filter that can drop rows is not passthrough."""
+        assert not config.is_passthrough()
+
+
+class TestLocationFilterSql:
+    """Tests that LOCATION_FILTER_SQL keeps the same rows as apply_location_filters."""
+
+    ROWS: tuple[tuple[str | None, ...], ...] = (
+        ("Route 1", "grass", "", ""),
+        ("Route 2", "surfing", "", ""),
+        ("Route 2", "old_rod", None, None),
+        ("Route 3", "good_rod", "", ""),
+        ("Route 3", "super_rod", "", ""),
+        ("Sea Route", "surfing", "Underwater", ""),
+        ("Cave", "rock_smash", "", ""),
+        ("Post-game Island", "grass", "", ""),
+        ("Route 4", "grass", "", "Beat the League"),
+        (None, None, None, None),
+    )
+
+    @pytest.fixture
+    def conn(self) -> Iterator[sqlite3.Connection]:
+        """Create an in-memory locations table covering every filter and NULL values."""
+        conn = sqlite3.connect(":memory:")
+        conn.execute(
+            "CREATE TABLE locations (location_name VARCHAR, encounter_method VARCHAR, "
+            "encounter_notes VARCHAR, requirement VARCHAR)"
+        )
+        conn.executemany("INSERT INTO locations VALUES (?, ?, ?, ?)", self.ROWS)
+        yield conn
+        conn.close()
+
+    @pytest.mark.parametrize(
+        "config",
+        [
+            LocationFilterConfig(),
+            LocationFilterConfig(has_surf=False),
+            LocationFilterConfig(has_dive=False),
+            LocationFilterConfig(rod_level="None"),
+            LocationFilterConfig(rod_level="Old Rod"),
+            LocationFilterConfig(rod_level="Good Rod"),
+            LocationFilterConfig(has_rock_smash=False),
+            LocationFilterConfig(post_game=False),
+            LocationFilterConfig(accessible_locations=("Route 2", "Cave")),
+            LocationFilterConfig(accessible_locations=()),
+            LocationFilterConfig(
+                has_surf=False,
+                has_dive=False,
+                rod_level="None",
+                has_rock_smash=False,
+                post_game=False,
+                accessible_locations=("Route 1", "Route 4"),
+            ),
+        ],
+    )
+    def test_matches_apply_location_filters(self, conn: sqlite3.Connection, config: LocationFilterConfig) -> None:
+        """SQL filtering keeps exactly the rows the Python filters keep."""
+        columns = ("location_name", "encounter_method", "encounter_notes", "requirement")
+        rows = [dict(zip(columns, row, strict=True)) for row in self.ROWS]
+        expected = sorted(i + 1 for i, row in enumerate(rows) if row in apply_location_filters(rows, config))
+
+        cursor = conn.execute(
+            f"SELECT rowid FROM locations WHERE {LOCATION_FILTER_SQL} ORDER BY rowid",  # noqa: S608
+            config.sql_params(),
+        )
+
+        assert [r[0] for r in cursor] == expected
+
+
 class TestApplyLocationFiltersCombined:
     """Tests for combined filter application."""
 
@@ -478,7 +577,10 @@ class TestGetPreEvolutions:
             ('Pichu', 'Pikachu', 'Friendship', '', 'pichu', 'pikachu'),
             ('Pikachu', 'Raichu', 'Stone', 'Thunder Stone', 'pikachu', 'raichu'),
             ('Bulbasaur', 'Ivysaur', 'Level', '16', 'bulbasaur', 'ivysaur'),
-            ('Ivysaur', 'Venusaur', 'Level', '32', 'ivysaur', 'venusaur')
+            ('Ivysaur', 'Venusaur', 'Level', '32', 'ivysaur', 'venusaur'),
+            ('Necrozma', 'Necrozma Dusk Mane', 'Item', 'N-Solarizer', 'necrozma', 'necrozma_dusk_mane'),
+            ('Necrozma Dusk Mane', 'Necrozma Ultra', 'Item', 'Ultranecrozium', 'necrozma_dusk_mane', 'necrozma_ultra'),
+            ('Necrozma Ultra', 'Necrozma Dusk Mane', 'Item', 'Ultranecrozium', 'necrozma_ultra', 'necrozma_dusk_mane')
         """)
 
         conn.commit()
@@ -510,6 +612,22 @@ class TestGetPreEvolutions:
         assert "Charmeleon" in result
         assert "Charmander" in result
 
+    def test_get_pre_evolutions_ordered_closest_first(self, test_db: Path) -> None:
+        """Pre-evolutions should be ordered from closest to furthest."""
+        result = get_pre_evolutions("Charizard", test_db)
+        assert result == ["Charmeleon", "Charmander"]
+
+    def test_get_pre_evolutions_terminates_on_cyclic_forms(self, test_db: Path) -> None:
+        """Cyclic form changes should be walked once and exclude the Pokemon itself."""
+        result = get_pre_evolutions("Necrozma Ultra", test_db)
+        assert result == ["Necrozma Dusk Mane", "Necrozma"]
+
+    def test_get_pre_evolutions_missing_table(self, tmp_path: Path) -> None:
+        """A database without an evolutions table should yield no pre-evolutions."""
+        db_path = tmp_path / "empty.sqlite"
+        sqlite3.connect(str(db_path)).close()
+        assert get_pre_evolutions("Charizard", db_path) == []
+
 
 class TestSearchPokemonLocationsWithPreEvolutions:
     """Tests for search_pokemon_locations including pre-evolution locations."""
@@ -548,7 +666,9 @@ class TestSearchPokemonLocationsWithPreEvolutions:
         conn.execute("""
             INSERT INTO evolutions VALUES
             ('Charmander', 'Charmeleon', 'Level', '16', 'charmander', 'charmeleon'),
-            ('Charmeleon', 'Charizard', 'Level', '36', 'charmeleon', 'charizard')
+            ('Charmeleon', 'Charizard', 'Level', '36', 'charmeleon', 'charizard'),
+            ('Necrozma Dusk Mane', 'Necrozma Ultra', 'Item', 'Ultranecrozium', 'necrozma_dusk_mane', 'necrozma_ultra'),
+            ('Necrozma Ultra', 'Necrozma Dusk Mane', 'Battle', '', 'necrozma_ultra', 'necrozma_dusk_mane')
         """)
 
         # Insert location data - Charmander is catchable, Charizard is not
@@ -556,7 +676,8 @@ class TestSearchPokemonLocationsWithPreEvolutions:
             INSERT INTO locations VALUES
             ('Charmander', 'charmander', 'Mt. Ember', 'grass', '', ''),
             ('Charmander', 'charmander', 'Fire Path', 'cave', '', 'Beat the League'),
-            ('Magikarp', 'magikarp', 'Route 1', 'old_rod', '', '')
+            ('Magikarp', 'magikarp', 'Route 1', 'old_rod', '', ''),
+            ('Necrozma Dusk Mane', 'necrozma_dusk_mane', 'Ultra Space', 'gift', '', '')
         """)
 
         conn.commit()
@@ -589,6 +710,12 @@ class TestSearchPokemonLocationsWithPreEvolutions:
         assert [r["pokemon"] for r in result] == ["Magikarp"]
         assert [r["location_name"] for r in result] == ["Route 1"]
 
+    def test_search_locations_terminates_on_cyclic_forms(self, test_db: Path) -> None:
+        """Form changes that cycle back (Necrozma) must not recurse forever."""
+        result = search_pokemon_locations("Necrozma Ultra", test_db)
+
+        assert [r["location_name"] for r in result] == ["Ultra Space"]
+
 
 class TestGetAllPokemonNamesFromLocations:
     """Tests for get_all_pokemon_names_from_locations including evolutions."""
@@ -662,6 +789,40 @@ class TestGetAllPokemonNamesFromLocations:
 
         assert result == sorted(result)
 
+    def test_cyclic_evolutions_terminate(self, tmp_path: Path) -> None:
+        """Form changes that cycle back (Necrozma) must not recurse forever."""
+        db_path = tmp_path / "cycle.sqlite"
+        conn = sqlite3.connect(str(db_path))
+        conn.execute(
+            "CREATE TABLE evolutions (from_pokemon VARCHAR, to_pokemon VARCHAR, method VARCHAR, condition VARCHAR)"
+        )
+        conn.execute("CREATE TABLE locations (pokemon VARCHAR, location_name VARCHAR)")
+        conn.execute("""
+            INSERT INTO evolutions VALUES
+            ('Necrozma Dusk Mane', 'Necrozma Ultra', 'Item', 'Ultranecrozium'),
+            ('Necrozma Ultra', 'Necrozma Dusk Mane', 'Battle', '')
+        """)
+        conn.execute("INSERT INTO locations VALUES ('Necrozma Dusk Mane', 'Ultra Space')")
+        conn.commit()
+        conn.close()
+
+        assert get_all_pokemon_names_from_locations(db_path) == ["Necrozma Dusk Mane", "Necrozma Ultra"]
+
+    def test_excludes_blank_names(self, tmp_path: Path) -> None:
+        """Blank or NULL names in locations or evolution targets should be skipped."""
+        db_path = tmp_path / "blank.sqlite"
+        conn = sqlite3.connect(str(db_path))
+        conn.execute(
+            "CREATE TABLE evolutions (from_pokemon VARCHAR, to_pokemon VARCHAR, method VARCHAR, condition VARCHAR)"
+        )
+        conn.execute("CREATE TABLE locations (pokemon VARCHAR, location_name VARCHAR)")
+        conn.execute("INSERT INTO evolutions VALUES ('Eevee', '', 'Item', 'Stone'), ('Eevee', NULL, 'Item', 'Stone')")
+        conn.execute("INSERT INTO locations VALUES ('Eevee', 'Route 4'), ('', 'Route 5'), (NULL, 'Route 6')")
+        conn.commit()
+        conn.close()
+
+        assert get_all_pokemon_names_from_locations(db_path) == ["Eevee"]
+
 
 class TestGetAllEvolutions:
     """Tests for the get_all_evolutions function.
@@ -696,7 +857,10 @@ class TestGetAllEvolutions:
             ('Pichu', 'Pikachu', 'Friendship', '', 'pichu', 'pikachu'),
             ('Pikachu', 'Raichu', 'Stone', 'Thunder Stone', 'pikachu', 'raichu'),
             ('Bulbasaur', 'Ivysaur', 'Level', '16', 'bulbasaur', 'ivysaur'),
-            ('Ivysaur', 'Venusaur', 'Level', '32', 'ivysaur', 'venusaur')
+            ('Ivysaur', 'Venusaur', 'Level', '32', 'ivysaur', 'venusaur'),
+            ('Necrozma', 'Necrozma Dusk Mane', 'Item', 'N-Solarizer', 'necrozma', 'necrozma_dusk_mane'),
+            ('Necrozma Dusk Mane', 'Necrozma Ultra', 'Item', 'Ultranecrozium', 'necrozma_dusk_mane', 'necrozma_ultra'),
+            ('Necrozma Ultra', 'Necrozma Dusk Mane', 'Item', 'Ultranecrozium', 'necrozma_ultra', 'necrozma_dusk_mane')
         """)
 
         conn.commit()
@@ -735,6 +899,11 @@ class TestGetAllEvolutions:
         result = get_all_evolutions("Ditto", test_db)
         assert result == []
 
+    def test_get_all_evolutions_terminates_on_cyclic_forms(self, test_db: Path) -> None:
+        """Cyclic form changes should be walked once and exclude the Pokemon itself."""
+        result = get_all_evolutions("Necrozma", test_db)
+        assert result == ["Necrozma Dusk Mane", "Necrozma Ultra"]
+
 
 class TestGetAvailablePokemonSet:
     """Tests for get_available_pokemon_set function."""
@@ -827,6 +996,16 @@ class TestGetAvailablePokemonSet:
         # But Charmander should still be available
         assert "Charmander" in result
 
+    def test_passthrough_matches_filtered_path(self, test_db: Path) -> None:
+        """Passthrough shortcut should agree with a filter that happens to keep every row."""
+        passthrough = get_available_pokemon_set(LocationFilterConfig(), test_db)
+        filtered = get_available_pokemon_set(
+            LocationFilterConfig(accessible_locations=("Mt. Ember", "Route 1")),
+            test_db,
+        )
+
+        assert passthrough == filtered
+
     def test_returns_empty_set_when_no_matches(self, test_db: Path) -> None:
         """Should return empty set when no locations match filters."""
         config = LocationFilterConfig(
@@ -1030,7 +1209,11 @@ class TestGetFirstBlockedEvolution:
             ('Charmeleon', 'Charizard', 'Level', '36', 'charmeleon', 'charizard'),
             ('Pichu', 'Pikachu', 'Friendship', '', 'pichu', 'pikachu'),
             ('Pikachu', 'Raichu', 'Stone', 'Thunder Stone', 'pikachu', 'raichu'),
-            ('Snover', 'Abomasnow', 'Level', '40', 'snover', 'abomasnow')
+            ('Snover', 'Abomasnow', 'Level', '40', 'snover', 'abomasnow'),
+            ('Cosmog', 'Cosmoem', 'Level', '43', 'cosmog', 'cosmoem'),
+            ('Necrozma', 'Necrozma-Dusk-Mane', 'Item', 'N-Solarizer', 'necrozma', 'necrozma-dusk-mane'),
+            ('Necrozma-Dusk-Mane', 'Necrozma-Ultra', 'Item', 'Ultranecrozium', 'necrozma-dusk-mane', 'necrozma-ultra'),
+            ('Necrozma-Ultra', 'Necrozma-Dusk-Mane', 'Level', '60', 'necrozma-ultra', 'necrozma-dusk-mane')
         """)
 
         conn.commit()
@@ -1086,3 +1269,116 @@ class TestGetFirstBlockedEvolution:
         assert result["from_pokemon"] == "Charmeleon"
         assert result["to_pokemon"] == "Charizard"
         assert result["level"] == 36
+
+    def test_reports_stored_name_casing(self, test_db: Path) -> None:
+        """Should return names as stored in the table, not as typed."""
+        result = get_first_blocked_evolution("cosmoem", level_cap=20, db_path=test_db)
+
+        assert result == {"from_pokemon": "Cosmog", "to_pokemon": "Cosmoem", "level": 43}
+
+    def test_cyclic_chain_terminates(self, test_db: Path) -> None:
+        """A cycle in the evolution table should not loop forever."""
+        result = get_first_blocked_evolution("Necrozma-Ultra", level_cap=50, db_path=test_db)
+
+        assert result == {"from_pokemon": "Necrozma-Ultra", "to_pokemon": "Necrozma-Dusk-Mane", "level": 60}
+
+    def test_rejoining_chain_uses_longest_path(self, tmp_path: Path) -> None:
+        """A step reachable along several paths counts at its longest depth."""
+        db_path = tmp_path / "rejoin.sqlite"
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("CREATE TABLE evolutions (from_pokemon TEXT, to_pokemon TEXT, method TEXT, condition TEXT)")
+        # Root reaches Top directly (depth 2) and via MidA -> MidB (depth 4);
+        # Side -> MidA is blocked at depth 3, Base -> Root at depth 2 or 4
+        conn.execute("""
+            INSERT INTO evolutions VALUES
+            ('Root', 'Top', 'Level', '10'),
+            ('MidB', 'Top', 'Level', '10'),
+            ('MidA', 'MidB', 'Level', '10'),
+            ('Root', 'MidA', 'Level', '10'),
+            ('Side', 'MidA', 'Level', '70'),
+            ('Base', 'Root', 'Level', '60')
+        """)
+        conn.commit()
+        conn.close()
+
+        result = get_first_blocked_evolution("Top", level_cap=50, db_path=db_path)
+
+        assert result == {"from_pokemon": "Base", "to_pokemon": "Root", "level": 60}
+
+    def test_missing_table_returns_none(self, tmp_path: Path) -> None:
+        """Should return None when the evolutions table does not exist."""
+        db_path = tmp_path / "empty.sqlite"
+        sqlite3.connect(str(db_path)).close()
+
+        assert get_first_blocked_evolution("Charizard", level_cap=10, db_path=db_path) is None
+
+
+class TestRefreshQueryCachesIfRebuilt:
+    """Tests for dropping cached query results after a database rebuild."""
+
+    @pytest.fixture
+    def test_db(self, tmp_path: Path) -> Path:
+        """Create a test database with one location."""
+        db_path = tmp_path / "test.sqlite"
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("CREATE TABLE locations (pokemon VARCHAR, location_name VARCHAR)")
+        conn.execute("INSERT INTO locations VALUES ('Pidgey', 'Route 1')")
+        conn.commit()
+        conn.close()
+        return db_path
+
+    def _add_location(self, db_path: Path) -> None:
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("INSERT INTO locations VALUES ('Zubat', 'Cave')")
+        conn.commit()
+        conn.close()
+        stat = db_path.stat()
+        os.utime(db_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def test_unchanged_database_keeps_cache(self, test_db: Path) -> None:
+        assert refresh_query_caches_if_rebuilt(test_db) is False
+        assert refresh_query_caches_if_rebuilt(test_db) is False
+
+    def test_changed_database_refreshes_results(self, test_db: Path) -> None:
+        refresh_query_caches_if_rebuilt(test_db)
+        assert get_all_location_names(test_db) == ["Route 1"]
+
+        self._add_location(test_db)
+        # Cached result is stale until the rebuild is detected
+        assert get_all_location_names(test_db) == ["Route 1"]
+
+        assert refresh_query_caches_if_rebuilt(test_db) is True
+        assert get_all_location_names(test_db) == ["Cave", "Route 1"]
+
+    def test_missing_database_mid_rebuild_reports_no_change(self, test_db: Path) -> None:
+        refresh_query_caches_if_rebuilt(test_db)
+        test_db.unlink()
+
+        assert refresh_query_caches_if_rebuilt(test_db) is False
+
+    def test_close_pools_closes_pool_recreated_after_invalidation(self, test_db: Path) -> None:
+        get_all_location_names(test_db)
+        invalidate_query_caches()
+        get_all_location_names(test_db)
+        pool = queries._pools[test_db]
+        with pool.connection() as conn:
+            pass
+
+        queries._close_pools()
+
+        assert queries._pools == {}
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+    def test_invalidate_closes_existing_pool_without_creating_one(self, test_db: Path) -> None:
+        invalidate_query_caches()
+        assert queries._pools == {}
+
+        get_all_location_names(test_db)
+        pool = queries._pools[test_db]
+        with pool.connection() as conn:
+            invalidate_query_caches()
+
+        assert queries._pools == {}
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
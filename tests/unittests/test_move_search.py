@@ -3,11 +3,23 @@
 
 import sqlite3
 from pathlib import Path
+from typing import Any
 
 import pytest
 
 from unbounddb.app.move_search_filters import MoveSearchFilters
-from unbounddb.app.queries import search_moves_advanced
+from unbounddb.app.queries import (
+    _build_progress_conditions,
+    get_available_moves,
+    get_available_types,
+    get_move_details,
+    get_move_details_many,
+    get_pokemon_by_type,
+    get_pokemon_details,
+    get_pokemon_details_many,
+    search_moves_advanced,
+    search_pokemon_by_type_and_move,
+)
 
 
 class TestMoveSearchFiltersDefaults:
@@ -292,6 +304,20 @@ class TestSearchMovesAdvancedGameProgress:
         results = search_moves_advanced(MoveSearchFilters(available_tm_keys=None), db_path=move_search_db)
         assert len(results) == 5
 
+    def test_filter_sql_does_not_depend_on_set_size(self) -> None:
+        small = MoveSearchFilters(available_pokemon=frozenset({"Gengar"}), available_tm_keys=frozenset({"tm1"}))
+        large = MoveSearchFilters(
+            available_pokemon=frozenset(f"Mon{i}" for i in range(500)),
+            available_tm_keys=frozenset(f"tm{i}" for i in range(100)),
+        )
+        built = []
+        for filters in (small, large):
+            conditions: list[str] = []
+            params: list[Any] = []
+            assert _build_progress_conditions(filters, conditions, params)
+            built.append((conditions, len(params)))
+        assert built[0] == built[1]
+
 
 class TestSearchMovesAdvancedCombined:
     """Tests for combined filters composing with AND logic."""
@@ -317,3 +343,84 @@ class TestSearchMovesAdvancedCombined:
     def test_no_results_returns_empty(self, move_search_db: Path) -> None:
         results = search_moves_advanced(MoveSearchFilters(move_types=("Fairy",)), db_path=move_search_db)
         assert results == []
+
+
+class TestMoveSearchCatalogs:
+    """Tests for the dropdown catalogs and the simple type/move Pokemon search."""
+
+    def test_available_types_sorted_unique(self, move_search_db: Path) -> None:
+        assert get_available_types(db_path=move_search_db) == ["Fighting", "Ghost", "Psychic"]
+
+    def test_available_moves_sorted(self, move_search_db: Path) -> None:
+        moves = get_available_moves(db_path=move_search_db)
+        assert moves == sorted(moves)
+        assert len(moves) == 5
+
+    def test_search_by_move(self, move_search_db: Path) -> None:
+        results = search_pokemon_by_type_and_move(move_name="Shadow Ball", db_path=move_search_db)
+        assert [r["name"] for r in results] == ["Gengar"]
+
+    def test_search_without_filters_ordered_by_bst(self, move_search_db: Path) -> None:
+        results = search_pokemon_by_type_and_move(db_path=move_search_db)
+        assert results[0]["name"] == "Machamp"
+
+    def test_search_by_move_learned_several_ways_returns_one_row(self, move_search_db: Path) -> None:
+        conn = sqlite3.connect(str(move_search_db))
+        conn.execute("INSERT INTO pokemon_moves VALUES ('gengar', 'shadow_ball', 'tm', NULL)")
+        conn.commit()
+        conn.close()
+        results = search_pokemon_by_type_and_move(move_name="Shadow Ball", db_path=move_search_db)
+        assert [r["name"] for r in results] == ["Gengar"]
+
+    def test_search_by_type_and_move_no_match(self, move_search_db: Path) -> None:
+        results = search_pokemon_by_type_and_move(
+            pokemon_type="Psychic", move_name="Shadow Ball", db_path=move_search_db
+        )
+        assert results == []
+
+
+class TestGetPokemonByType:
+    """Tests for get_pokemon_by_type with and without an available-Pokemon filter."""
+
+    def test_matches_either_type_slot(self, move_search_db: Path) -> None:
+        results = get_pokemon_by_type("Poison", db_path=move_search_db)
+        assert [r["name"] for r in results] == ["Gengar"]
+
+    def test_available_filter_applied(self, move_search_db: Path) -> None:
+        results = get_pokemon_by_type("Ghost", frozenset({"Alakazam"}), db_path=move_search_db)
+        assert results == []
+
+    def test_available_filter_keeps_members(self, move_search_db: Path) -> None:
+        results = get_pokemon_by_type("Ghost", frozenset({"Gengar", "Alakazam"}), db_path=move_search_db)
+        assert [r["name"] for r in results] == ["Gengar"]
+
+    def test_empty_available_set_returns_nothing(self, move_search_db: Path) -> None:
+        assert get_pokemon_by_type("Ghost", frozenset(), db_path=move_search_db) == []
+
+    def test_cached_per_available_set(self, move_search_db: Path) -> None:
+        with_gengar = frozenset({"Gengar", "Alakazam"})
+        assert [r["name"] for r in get_pokemon_by_type("Ghost", with_gengar, db_path=move_search_db)] == ["Gengar"]
+        assert get_pokemon_by_type("Ghost", frozenset({"Alakazam"}), db_path=move_search_db) == []
+        assert get_pokemon_by_type("Ghost", frozenset(with_gengar), db_path=move_search_db)[0]["name"] == "Gengar"
+
+
+class TestDetailsMany:
+    """Tests for the batched move and Pokemon detail lookups."""
+
+    def test_move_details_many_matches_single_lookups(self, move_search_db: Path) -> None:
+        keys = ("shadow_ball", "psychic")
+        results = get_move_details_many(keys, db_path=move_search_db)
+        assert results == {k: get_move_details(k, db_path=move_search_db) for k in keys}
+
+    def test_move_details_many_omits_unknown_keys(self, move_search_db: Path) -> None:
+        results = get_move_details_many(("shadow_ball", "splash"), db_path=move_search_db)
+        assert set(results) == {"shadow_ball"}
+
+    def test_move_details_many_empty_keys(self, move_search_db: Path) -> None:
+        assert get_move_details_many((), db_path=move_search_db) == {}
+
+    def test_pokemon_details_many_matches_single_lookups(self, move_search_db: Path) -> None:
+        keys = ("gengar", "machamp", "missingno")
+        results = get_pokemon_details_many(keys, db_path=move_search_db)
+        assert set(results) == {"gengar", "machamp"}
+        assert results["gengar"] == get_pokemon_details("gengar", db_path=move_search_db)
@@ -37,6 +37,12 @@ class TestSlugify:
         """Hyphens are converted to underscores."""
         assert slugify("Ho-Oh") == "ho_oh"
 
+    def test_repeated_calls_are_memoized(self) -> None:
+        """Slugifying the same name again is served from the cache."""
+        slugify.cache_clear()
+        assert slugify("Shadow Ball") == slugify("Shadow Ball") == "shadow_ball"
+        assert slugify.cache_info().hits == 1
+
     def test_empty_string(self) -> None:
         """Empty string returns empty string."""
         assert slugify("") == ""
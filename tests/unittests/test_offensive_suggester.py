@@ -5,9 +5,17 @@ from itertools import combinations
 
 import pytest
 
+from unbounddb.app.tools.offensive_suggester import (
+    _CATEGORY_BY_EFFECTIVENESS,
+    _combo_coverage,
+    _score_single_type,
+    _score_type_combo,
+)
 from unbounddb.utils.type_chart import (
+    TYPE_INDEX,
     TYPES,
     get_effectiveness,
+    type_index,
 )
 
 
@@ -68,6 +76,39 @@ class TestSingleTypeScoring:
         assert eff_fighting == 0.0
 
 
+class TestCategoryByEffectiveness:
+    """Tests for the precomputed multiplier-to-category labels."""
+
+    def test_labels_every_chart_multiplier(self) -> None:
+        """Each distinct multiplier in the chart maps to its category."""
+        assert _CATEGORY_BY_EFFECTIVENESS == {
+            0.0: "immune",
+            0.25: "resisted",
+            0.5: "resisted",
+            1.0: "neutral",
+            2.0: "2x",
+            4.0: "4x",
+        }
+
+
+class TestScoreSingleType:
+    """Tests for counting categories of one attacking type against a team."""
+
+    def test_counts_each_category(self) -> None:
+        """Ground against Fire/Rock, Flying, Electric, Water, Grass/Bug hits every category."""
+        team = [("Fire", "Rock"), ("Flying", None), ("Electric", None), ("Water", None), ("Grass", "Bug")]
+        defender_indexes = [(TYPE_INDEX[t1], type_index(t2)) for t1, t2 in team]
+
+        result = _score_single_type("Ground", defender_indexes)
+
+        assert result["4x_count"] == 1
+        assert result["immune_count"] == 1
+        assert result["2x_count"] == 1
+        assert result["neutral_count"] == 1
+        assert result["resisted_count"] == 1
+        assert result["score"] == 8 + 4 - 2 - 6
+
+
 class TestFourTypeCoverage:
     """Tests for 4-type coverage algorithm."""
 
@@ -136,6 +177,41 @@ class TestFourTypeCoverage:
         assert len(combos) == 3060
 
 
+class TestScoreTypeCombo:
+    """Tests for scoring one combination from per-type effectiveness rows."""
+
+    def test_scores_best_effectiveness_per_pokemon(self) -> None:
+        """Each Pokemon takes its best multiplier across the rows."""
+        rows = ((2.0, 0.5, 1.0), (1.0, 4.0, 0.5), (0.0, 1.0, 1.0), (1.0, 1.0, 0.5))
+
+        # Best: 2.0, 4.0, 1.0 -> 2 covered, 1 uncovered
+        assert _combo_coverage(rows) == (2, int(2 * 10 + 7.0 * 2 - 1 * 15))
+
+    def test_builds_result_from_coverage(self) -> None:
+        """The result dict carries the computed coverage unchanged."""
+        result = _score_type_combo(("Fire", "Water", "Grass", "Ice"), 2, 3, 19)
+
+        assert result == {
+            "types": "Fire, Water, Grass, Ice",
+            "covered_count": 2,
+            "total_pokemon": 3,
+            "coverage_pct": 66.7,
+            "score": 19,
+        }
+
+    def test_matches_get_effectiveness_reference(self) -> None:
+        """Scores from table rows match a get_effectiveness reference loop."""
+        pokemon_list = [("Fire", "Flying"), ("Water", None), ("Dark", "Ghost")]
+        types = ("Ground", "Ice", "Electric", "Fairy")
+        rows = tuple(tuple(get_effectiveness(t, t1, t2) for t1, t2 in pokemon_list) for t in types)
+
+        best = [max(get_effectiveness(t, t1, t2) for t in types) for t1, t2 in pokemon_list]
+        covered = sum(1 for b in best if b >= 2.0)
+        expected = int(covered * 10 + sum(best) * 2 - (len(best) - covered) * 15)
+
+        assert _combo_coverage(rows) == (covered, expected)
+
+
 class TestEdgeCases:
     """Tests for edge cases and boundary conditions."""
 
@@ -1,14 +1,47 @@
 # ABOUTME: Unit tests for Physical/Special analyzer functions.
-# ABOUTME: Tests classification logic for offensive and defensive profiles.
+# ABOUTME: Tests profile classification and the battle offensive profile against SQLite.
+
+import pickle
+import sqlite3
+from pathlib import Path
 
 import pytest
 
 from unbounddb.app.tools.phys_spec_analyzer import (
+    _build_pokemon_offensive_detail,
+    analyze_battle_defensive_profile,
+    analyze_battle_offensive_profile,
     classify_pokemon_defensive_profile,
     classify_pokemon_offensive_profile,
+    get_battle_pokemon_with_stats,
 )
 
 
+@pytest.fixture
+def battle_db(tmp_path: Path) -> Path:
+    """Create a test database with a two-Pokemon team where one has no moves."""
+    db_path = tmp_path / "test.sqlite"
+    conn = sqlite3.connect(str(db_path))
+    conn.execute("CREATE TABLE battle_pokemon (id INTEGER, battle_id INTEGER, pokemon_key VARCHAR, slot INTEGER)")
+    conn.execute(
+        "CREATE TABLE pokemon (pokemon_key VARCHAR, attack INTEGER, defense INTEGER, "
+        "sp_attack INTEGER, sp_defense INTEGER)"
+    )
+    conn.execute("CREATE TABLE battle_pokemon_moves (battle_pokemon_id INTEGER, move_key VARCHAR, slot INTEGER)")
+    conn.execute("CREATE TABLE moves (move_key VARCHAR, name VARCHAR, category VARCHAR, power INTEGER)")
+    conn.execute("INSERT INTO battle_pokemon VALUES (10, 1, 'machamp', 1), (11, 1, 'ditto', 2)")
+    conn.execute("INSERT INTO pokemon VALUES ('machamp', 130, 80, 65, 85), ('ditto', 48, 48, 48, 48)")
+    conn.execute(
+        "INSERT INTO battle_pokemon_moves VALUES (10, 'cross_chop', 1), (10, 'bulk_up', 2), (10, 'missing', 3)"
+    )
+    conn.execute(
+        "INSERT INTO moves VALUES ('cross_chop', 'Cross Chop', 'Physical', 100), ('bulk_up', 'Bulk Up', 'Status', 0)"
+    )
+    conn.commit()
+    conn.close()
+    return db_path
+
+
 class TestOffensiveProfileClassification:
     """Tests for classify_pokemon_offensive_profile function."""
 
@@ -220,3 +253,89 @@ class TestDefensiveStatVariations:
     def test_stat_combinations(self, defense: int, sp_defense: int, expected: str) -> None:
         """Parametrized test for various stat combinations."""
         assert classify_pokemon_defensive_profile(defense, sp_defense) == expected
+
+
+_DETAIL_ROW = {"pokemon_key": "mon", "slot": 1, "attack": 100, "sp_attack": 80}
+
+
+class TestBuildPokemonOffensiveDetail:
+    """Tests for _build_pokemon_offensive_detail."""
+
+    @pytest.mark.parametrize(
+        "moves",
+        [
+            [("Tackle", "Physical", 40), ("Growl", "Status", 0)],
+            [("Ember", "Special", 40), ("Scratch", "Physical", 0)],
+            [("Tackle", "Physical", 40), ("Ember", "Special", None), ("Surf", "Special", 90)],
+            [("Growl", "Status", 0)],
+            [],
+        ],
+    )
+    def test_profile_matches_classifier(self, moves: list[tuple[str, str, int | None]]) -> None:
+        """The detail's profile follows classify_pokemon_offensive_profile on the same moves."""
+        move_dicts = [{"move_name": name, "category": category, "power": power} for name, category, power in moves]
+
+        detail, _, _ = _build_pokemon_offensive_detail(_DETAIL_ROW, move_dicts)
+
+        assert detail.profile == classify_pokemon_offensive_profile(move_dicts)
+
+    def test_lists_damaging_moves_and_sums_power(self) -> None:
+        """Only moves with power count toward the names and power totals."""
+        moves = [
+            {"move_name": "Tackle", "category": "Physical", "power": 40},
+            {"move_name": "Surf", "category": "Special", "power": 90},
+            {"move_name": "Counter", "category": "Physical", "power": None},
+            {"move_name": "Slash", "category": "Physical", "power": 70},
+        ]
+
+        detail, phys_power, spec_power = _build_pokemon_offensive_detail(_DETAIL_ROW, moves)
+
+        assert detail.physical_moves == ("Tackle", "Slash")
+        assert detail.special_moves == ("Surf",)
+        assert (phys_power, spec_power) == (110, 90)
+
+
+class TestAnalyzeBattleOffensiveProfile:
+    """Tests for analyze_battle_offensive_profile against a real database."""
+
+    def test_profiles_team_from_single_query(self, battle_db: Path) -> None:
+        """Stats and moves are combined per slot, including a Pokemon with no moves."""
+        result = analyze_battle_offensive_profile(1, battle_db)
+
+        assert result["physical_count"] == 1
+        assert result["mixed_count"] == 1
+        assert result["total_physical_power"] == 100
+        assert result["avg_team_attack"] == 89.0
+        assert [d.physical_moves for d in result["pokemon_details"]] == [("Cross Chop",), ()]
+
+    def test_details_survive_cache_pickling(self, battle_db: Path) -> None:
+        """st.cache_data pickles results, so the slotted details must round-trip."""
+        result = analyze_battle_offensive_profile(1, battle_db)
+
+        assert pickle.loads(pickle.dumps(result)) == result  # noqa: S301 - round-trips our own bytes
+
+    def test_unknown_battle_returns_empty_profile(self, battle_db: Path) -> None:
+        """A battle with no team rows yields the empty profile."""
+        result = analyze_battle_offensive_profile(99, battle_db)
+
+        assert result["recommendation"] == "No data available"
+        assert result["pokemon_details"] == []
+
+
+class TestBattleStats:
+    """Tests for the cached stats helper and the defensive profile built on the same rows."""
+
+    def test_stats_in_slot_order(self, battle_db: Path) -> None:
+        result = get_battle_pokemon_with_stats(1, battle_db)
+
+        assert [(r["pokemon_key"], r["defense"], r["sp_defense"]) for r in result] == [
+            ("machamp", 80, 85),
+            ("ditto", 48, 48),
+        ]
+
+    def test_defensive_profile_uses_same_rows(self, battle_db: Path) -> None:
+        result = analyze_battle_defensive_profile(1, battle_db)
+
+        assert [(d.pokemon_key, d.defense, d.sp_defense) for d in result["pokemon_details"]] == [
+            (r["pokemon_key"], r["defense"], r["sp_defense"]) for r in get_battle_pokemon_with_stats(1, battle_db)
+        ]
@@ -5,6 +5,9 @@ import pytest
 
 from unbounddb.utils.type_chart import (
     EFFECTIVENESS,
+    EFFECTIVENESS_TABLE,
+    NO_TYPE_INDEX,
+    TYPE_INDEX,
     TYPES,
     generate_all_type_combinations,
     get_effectiveness,
@@ -13,6 +16,7 @@ from unbounddb.utils.type_chart import (
     get_resistances,
     get_weaknesses,
     score_defensive_typing,
+    type_index,
 )
 
 
@@ -103,6 +107,29 @@ class TestGetEffectiveness:
         assert get_effectiveness("Fairy", "Steel") == 0.5
 
 
+class TestEffectivenessTable:
+    """Tests for the precomputed EFFECTIVENESS_TABLE lookup."""
+
+    def test_shape(self) -> None:
+        """Table should be 18 attackers x 18 primary types x 19 secondary slots."""
+        assert len(EFFECTIVENESS_TABLE) == 18
+        assert all(len(row) == 18 for row in EFFECTIVENESS_TABLE)
+        assert all(len(col) == 19 for row in EFFECTIVENESS_TABLE for col in row)
+
+    def test_matches_get_effectiveness(self) -> None:
+        """Every cell should equal the scalar calculation."""
+        for atk in TYPES:
+            for def1 in TYPES:
+                for def2 in [*TYPES, None]:
+                    cell = EFFECTIVENESS_TABLE[TYPE_INDEX[atk]][TYPE_INDEX[def1]][type_index(def2)]
+                    assert cell == get_effectiveness(atk, def1, def2)
+
+    def test_type_index_none_is_monotype_slot(self) -> None:
+        """None should map to the trailing monotype column."""
+        assert type_index(None) == NO_TYPE_INDEX == 18
+        assert type_index("Fairy") == 17
+
+
 class TestGetWeaknesses:
     """Tests for get_weaknesses function."""
 
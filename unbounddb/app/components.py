@@ -45,12 +45,18 @@ def render_move_with_tooltip(move_name: str, move_key: str | None = None) -> Non
             st.write(f"No details found for {move_name}")
 
 
-def render_pokemon_with_popup(pokemon_name: str, pokemon_key: str | None = None) -> None:
+def render_pokemon_with_popup(
+    pokemon_name: str,
+    pokemon_key: str | None = None,
+    details: dict[str, str | int | None] | None = None,
+) -> None:
     """Render Pokemon name with info icon popover showing stats and abilities.
 
     Args:
         pokemon_name: Display name of the Pokemon.
         pokemon_key: Slugified pokemon key. If None, will be computed from pokemon_name.
+        details: Details already fetched with get_pokemon_details_many. If None,
+            they are looked up with get_pokemon_details.
     """
     if pokemon_key is None:
         pokemon_key = slugify(pokemon_name)
@@ -59,7 +65,8 @@ def render_pokemon_with_popup(pokemon_name: str, pokemon_key: str | None = None)
     cols[0].write(pokemon_name)
 
     with cols[1], st.popover(":material/info:", use_container_width=True):
-        details = get_pokemon_details(pokemon_key)
+        if details is None:
+            details = get_pokemon_details(pokemon_key)
         if details:
             st.markdown(f"**{details['name']}**")
 
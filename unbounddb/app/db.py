@@ -1,16 +1,46 @@
 # ABOUTME: Lightweight SQLite connection and query helpers for the app layer.
 # ABOUTME: Avoids importing Polars/PyArrow so Streamlit Cloud stays under memory limits.
 
+import logging
+import queue
 import sqlite3
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
+logger = logging.getLogger(__name__)
 
-def get_connection(db_path: Path) -> sqlite3.Connection:
+DEFAULT_POOL_SIZE = 4
+
+# Prepared statements kept per connection, keyed by SQL text. Query SQL is held
+# in module constants so repeated calls hit this cache; dynamically built queries
+# (type/move and move searches) add variants on top, so the default 128 is doubled.
+STATEMENT_CACHE_SIZE = 256
+
+# Per-connection tuning for read-only app connections. The built database is
+# never written by the app, so journal and sync settings (which need a writer)
+# are left alone; these only affect how reads are cached and spilled.
+# The page cache is per connection, so it is sized to the built database
+# (about 10 MB) rather than generously: 16 MiB holds the whole file, and a full
+# pool of DEFAULT_POOL_SIZE connections stays within 64 MiB on the hosted app.
+_READ_PRAGMAS = (
+    "PRAGMA query_only = 1",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -16384",  # up to 16 MiB of page cache
+    "PRAGMA mmap_size = 268435456",  # map up to 256 MiB instead of read() syscalls
+)
+
+
+def get_connection(db_path: Path, read_only: bool = False) -> sqlite3.Connection:
     """Get a connection to an existing database.
 
     Args:
         db_path: Path to the database file.
+        read_only: If True, open with SQLite's ``mode=ro`` so the connection
+            takes no write locks and rejects any modification, and tune it
+            for reads (memory-mapped I/O, larger page cache, in-memory temp
+            storage).
 
     Returns:
         SQLite connection.
@@ -21,12 +51,120 @@ def get_connection(db_path: Path) -> sqlite3.Connection:
     if not db_path.exists():
         raise FileNotFoundError(f"Database not found: {db_path}")
 
-    return sqlite3.connect(str(db_path), check_same_thread=False)
+    if read_only:
+        uri = f"{db_path.resolve().as_uri()}?mode=ro"
+        conn = sqlite3.connect(uri, uri=True, check_same_thread=False, cached_statements=STATEMENT_CACHE_SIZE)
+        for pragma in _READ_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    return sqlite3.connect(str(db_path), check_same_thread=False, cached_statements=STATEMENT_CACHE_SIZE)
+
+
+class ConnectionPool:
+    """Thread-safe pool of reusable SQLite connections to a single database file.
+
+    Connections are opened lazily and returned to the pool after each use, so
+    Streamlit reruns and concurrent sessions reuse open connections instead of
+    reconnecting per query. At most ``max_size`` idle connections are kept;
+    borrowing never blocks, so nested borrows from cached helpers cannot deadlock.
+    """
+
+    def __init__(self, db_path: Path, max_size: int = DEFAULT_POOL_SIZE, read_only: bool = True) -> None:
+        """Initialize an empty pool.
+
+        Args:
+            db_path: Path to the database file.
+            max_size: Maximum number of idle connections kept for reuse.
+            read_only: Whether pooled connections are opened read-only.
+        """
+        self.db_path = db_path
+        self.read_only = read_only
+        self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue(maxsize=max_size)
+        self._closed = False
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection for the duration of a ``with`` block.
+
+        Yields:
+            An open SQLite connection, reused from the pool when one is idle.
+
+        Raises:
+            FileNotFoundError: If database doesn't exist.
+        """
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = get_connection(self.db_path, read_only=self.read_only)
+
+        try:
+            yield conn
+        finally:
+            self._release(conn)
+
+    def _release(self, conn: sqlite3.Connection) -> None:
+        """Return a borrowed connection to the pool, or close it if it cannot be reused.
+
+        A transaction left open by the borrower is rolled back first so the next
+        borrower starts clean; a connection that fails the rollback is discarded.
+        Once the pool is closed, returned connections are closed instead.
+        """
+        if self._closed:
+            _close_quietly(conn)
+            return
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            self._idle.put_nowait(conn)
+        except (sqlite3.Error, queue.Full):
+            _close_quietly(conn)
+
+    def warm(self, tables: Sequence[str]) -> None:
+        """Read the given tables once so the first real query finds them cached.
+
+        Opens a pooled connection and scans each existing table, pulling its
+        pages into the OS page cache and that connection's page cache. Errors
+        are logged and ignored; warming is only an optimization.
+
+        Args:
+            tables: Names of tables to scan; missing tables are skipped.
+        """
+        try:
+            with self.connection() as conn:
+                existing = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+                for table in tables:
+                    if table in existing:
+                        # Table names are checked against sqlite_master above
+                        conn.execute(f'SELECT COUNT(*) FROM "{table}"').fetchone()  # noqa: S608
+        except (sqlite3.Error, FileNotFoundError):
+            logger.debug("Could not warm connection pool for %s", self.db_path, exc_info=True)
+
+    def close(self) -> None:
+        """Close all idle connections and close borrowed ones when they are returned."""
+        self._closed = True
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            _close_quietly(conn)
+
+
+def _close_quietly(conn: sqlite3.Connection) -> None:
+    """Close a connection, logging instead of raising if the close fails."""
+    try:
+        conn.close()
+    except sqlite3.Error:
+        logger.warning("Failed to close SQLite connection", exc_info=True)
 
 
 def fetchall_to_dicts(cursor: sqlite3.Cursor) -> list[dict[str, Any]]:
     """Convert a SQLite cursor result to a list of dictionaries.
 
+    Iterates the cursor directly, so the row tuples are not all held in an
+    intermediate fetchall() list alongside the dicts built from them.
+
     Args:
         cursor: Executed SQLite cursor with results.
 
@@ -36,7 +174,44 @@ def fetchall_to_dicts(cursor: sqlite3.Cursor) -> list[dict[str, Any]]:
     if cursor.description is None:
         return []
 
+    column_names = [desc[0] for desc in cursor.description]
+    return [dict(zip(column_names, row, strict=True)) for row in cursor]
+
+
+def fetchall_column(cursor: sqlite3.Cursor) -> list[Any]:
+    """Collect the values of a single-column SQLite cursor result.
+
+    Iterates the cursor directly instead of materializing a list of
+    1-tuples with fetchall() first.
+
+    Args:
+        cursor: Executed SQLite cursor selecting exactly one column.
+
+    Returns:
+        List of the column's values, one per row.
+    """
+    return [value for (value,) in cursor]
+
+
+def fetchall_to_columns(cursor: sqlite3.Cursor) -> dict[str, list[Any]]:
+    """Convert a SQLite cursor result to column-oriented lists.
+
+    Holds one list per column instead of one dict per row, which roughly
+    halves memory and pickling time for large results such as full-table
+    previews cached by Streamlit.
+
+    Args:
+        cursor: Executed SQLite cursor with results.
+
+    Returns:
+        Dict mapping each column name to its values in row order.
+    """
+    if cursor.description is None:
+        return {}
+
     column_names = [desc[0] for desc in cursor.description]
     rows = cursor.fetchall()
+    if not rows:
+        return {name: [] for name in column_names}
 
-    return [dict(zip(column_names, row, strict=True)) for row in rows]
+    return {name: list(values) for name, values in zip(column_names, zip(*rows, strict=True), strict=True)}
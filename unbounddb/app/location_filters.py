@@ -1,6 +1,7 @@
 # ABOUTME: Filter functions for Pokemon catch location data.
 # ABOUTME: Provides filtering based on HMs, rods, accessibility, and game progress.
 
+import json
 from dataclasses import dataclass
 from typing import Any
 
@@ -29,6 +30,57 @@ class LocationFilterConfig:
     level_cap: int | None = None
     available_hms: frozenset[str] = frozenset()
 
+    def sql_params(self) -> dict[str, Any]:
+        """Build the named parameters for LOCATION_FILTER_SQL.
+
+        Returns:
+            Dict binding every placeholder in LOCATION_FILTER_SQL for this config.
+        """
+        return {
+            "has_surf": self.has_surf,
+            "has_dive": self.has_dive,
+            "rod_excluded": json.dumps(sorted(_get_excluded_rod_methods(self.rod_level))),
+            "has_rock_smash": self.has_rock_smash,
+            "post_game": self.post_game,
+            "accessible": json.dumps(self.accessible_locations) if self.accessible_locations else None,
+        }
+
+    def is_passthrough(self) -> bool:
+        """Return True if the location filters keep every row.
+
+        level_cap and available_hms are not checked because they do not filter location rows.
+
+        Returns:
+            True if apply_location_filters would return its input unchanged.
+        """
+        return (
+            self.has_surf
+            and self.has_dive
+            and self.rod_level == "Super Rod"
+            and self.has_rock_smash
+            and self.post_game
+            and not self.accessible_locations
+        )
+
+
+# SQL form of apply_location_filters over locations rows, so queries can filter
+# without fetching every row into Python. Bind with LocationFilterConfig.sql_params().
+# NULL-safe comparisons (IS NOT, COALESCE) match the Python filters on missing values.
+LOCATION_FILTER_SQL = """
+    (:has_surf OR encounter_method IS NOT 'surfing')
+    AND (:has_dive OR instr(COALESCE(encounter_notes, ''), 'Underwater') = 0)
+    AND COALESCE(encounter_method, '') NOT IN (SELECT value FROM json_each(:rod_excluded))
+    AND (:has_rock_smash OR encounter_method IS NOT 'rock_smash')
+    AND (
+        :post_game
+        OR (
+            instr(COALESCE(location_name, ''), 'Post-game') = 0
+            AND instr(COALESCE(requirement, ''), 'Beat the League') = 0
+        )
+    )
+    AND (:accessible IS NULL OR location_name IN (SELECT value FROM json_each(:accessible)))
+"""
+
 
 def _get_excluded_rod_methods(rod_level: str) -> set[str]:
     """Return encounter methods excluded by the current rod level.
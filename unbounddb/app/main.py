@@ -25,13 +25,15 @@ from unbounddb.app.move_search import render_move_search_tab
 from unbounddb.app.queries import (
     get_all_pokemon_names_from_locations,
     get_available_pokemon_set,
-    get_battle_by_id,
+    get_battle_with_team,
     get_battles_by_difficulty,
     get_difficulties,
     get_first_blocked_evolution,
-    get_move_details,
+    get_move_details_many,
+    get_pokemon_details_many,
     get_table_list,
     get_table_preview,
+    refresh_query_caches_if_rebuilt,
     search_pokemon_locations,
 )
 from unbounddb.app.tm_availability import get_available_tm_move_keys
@@ -43,7 +45,6 @@ from unbounddb.app.tools.defensive_suggester import (
 from unbounddb.app.tools.offensive_suggester import (
     analyze_four_type_coverage,
     analyze_single_type_offense,
-    get_battle_pokemon_types,
     get_single_type_detail,
     get_type_coverage_detail,
 )
@@ -100,6 +101,9 @@ if not settings.db_path.exists():
     )
     st.stop()
 
+# Drop cached query results if the database was rebuilt while the app is running
+refresh_query_caches_if_rebuilt()
+
 # Load available options
 try:
     tables = get_table_list()
@@ -299,8 +303,9 @@ with tab1:
         if selected_table:
             limit = None if show_all else 100
             preview = get_table_preview(selected_table, limit=limit)
-            row_label = "all" if show_all else f"{len(preview)} of"
-            st.subheader(f"{selected_table} ({row_label} {len(preview)} rows)")
+            row_count = len(next(iter(preview.values()), []))
+            row_label = "all" if show_all else f"{row_count} of"
+            st.subheader(f"{selected_table} ({row_label} {row_count} rows)")
             st.dataframe(
                 preview,
                 width="stretch",
@@ -361,15 +366,16 @@ with tab2:
         st.warning("No battles found in the database. Please run `unbounddb build` first.")
     elif analyzed_battle_id is not None:
         battle_id = analyzed_battle_id
-        battle_info = get_battle_by_id(battle_id)
+        battle_with_team = get_battle_with_team(battle_id)
 
-        if battle_info:
+        if battle_with_team:
             # Display battle header
+            battle_info = battle_with_team["battle"]
             difficulty_str = f" ({battle_info['difficulty']})" if battle_info["difficulty"] else ""
             st.header(f"Battle: {battle_info['name']}{difficulty_str}")
 
-            # Get battle's team info
-            pokemon_types = get_battle_pokemon_types(battle_id)
+            # Battle's team came back with the battle row
+            pokemon_types = battle_with_team["team"]
             team_names = [p["pokemon_key"] for p in pokemon_types]
             if team_names:
                 st.markdown(f"**Team:** {', '.join(team_names)}")
@@ -647,12 +653,12 @@ with tab2:
                         # Per-Pokemon breakdown
                         with st.expander("Per-Pokemon Breakdown"):
                             for pdetail in offensive_profile["pokemon_details"]:
-                                pokemon_key = pdetail["pokemon_key"]
-                                profile = pdetail["profile"]
-                                attack = pdetail["attack"]
-                                sp_attack = pdetail["sp_attack"]
-                                phys_moves = pdetail["physical_moves"]
-                                spec_moves = pdetail["special_moves"]
+                                pokemon_key = pdetail.pokemon_key
+                                profile = pdetail.profile
+                                attack = pdetail.attack
+                                sp_attack = pdetail.sp_attack
+                                phys_moves = pdetail.physical_moves
+                                spec_moves = pdetail.special_moves
 
                                 move_info = []
                                 if phys_moves:
@@ -702,10 +708,10 @@ with tab2:
                         # Per-Pokemon breakdown
                         with st.expander("Per-Pokemon Breakdown"):
                             for pdetail in defensive_profile["pokemon_details"]:
-                                pokemon_key = pdetail["pokemon_key"]
-                                profile = pdetail["profile"]
-                                defense = pdetail["defense"]
-                                sp_defense = pdetail["sp_defense"]
+                                pokemon_key = pdetail.pokemon_key
+                                profile = pdetail.profile
+                                defense = pdetail.defense
+                                sp_defense = pdetail.sp_defense
 
                                 st.write(f"- **{pokemon_key}** (Def: {defense}, SpD: {sp_defense}): {profile}")
 
@@ -784,6 +790,10 @@ with tab2:
 
                         # Expanders for top Pokemon details
                         st.subheader("Detailed Breakdown")
+                        # Fetch popup stats for every expanded Pokemon in one query
+                        pokemon_details_by_key = get_pokemon_details_many(
+                            tuple(row["pokemon_key"] for row in rankings[:10])
+                        )
                         for row in rankings[:10]:
                             type_combo = row["type1"]
                             if row["type2"]:
@@ -795,7 +805,11 @@ with tab2:
                                 # Quick action buttons
                                 btn_col1, btn_col2, btn_col3 = st.columns([0.3, 0.35, 0.35])
                                 with btn_col1:
-                                    render_pokemon_with_popup(row["name"], row["pokemon_key"])
+                                    render_pokemon_with_popup(
+                                        row["name"],
+                                        row["pokemon_key"],
+                                        pokemon_details_by_key.get(row["pokemon_key"]),
+                                    )
                                 with btn_col2:
                                     if st.button(
                                         ":material/location_on: Locations",
@@ -868,6 +882,8 @@ with tab2:
                                     st.markdown("**Recommended Moves:**")
 
                                     # Display moves table with full details
+                                    # Fetch accuracy/PP for every recommended move in one query
+                                    details_by_key = get_move_details_many(tuple(m["move_key"] for m in good_moves))
                                     moves_table = []
                                     for move in good_moves:  # Show all diversified moves (max 15)
                                         stab_str = "Yes" if move["is_stab"] else "No"
@@ -875,8 +891,8 @@ with tab2:
                                         if move["level"] and move["level"] > 0:
                                             learn_str = f"{move['learn_method']} ({move['level']})"
 
-                                        # Get additional move details (accuracy, PP)
-                                        move_details = get_move_details(move["move_key"])
+                                        # Additional move details (accuracy, PP)
+                                        move_details = details_by_key.get(move["move_key"])
                                         acc_str = (
                                             f"{move_details['accuracy']}%"
                                             if move_details and move_details["accuracy"]
@@ -908,8 +924,11 @@ with tab2:
             "to find the best defensive and offensive type combinations against that battle's team."
         )
 
+
 # Tab 3: Pokemon Locations
-with tab3:
+@st.fragment
+def _render_location_search(filter_config: LocationFilterConfig | None) -> None:
+    """Render the catch-location search. Runs as a fragment so picking a Pokemon reruns only this tab."""
     # Get available Pokemon for search
     location_pokemon = get_all_pokemon_names_from_locations()
 
@@ -939,7 +958,7 @@ with tab3:
             st.warning(f"No catch locations found for {selected_pokemon}.")
         else:
             # Apply global filters
-            filtered_rows = apply_location_filters(location_rows, global_filter_config)
+            filtered_rows = apply_location_filters(location_rows, filter_config)
 
             if not filtered_rows:
                 unfiltered_pokemon = {r["pokemon"] for r in location_rows}
@@ -962,16 +981,16 @@ with tab3:
                 catchable_names = {r["pokemon"] for r in filtered_rows}
                 if (
                     selected_pokemon not in catchable_names
-                    and global_filter_config is not None
-                    and global_filter_config.level_cap is not None
+                    and filter_config is not None
+                    and filter_config.level_cap is not None
                 ):
-                    block = get_first_blocked_evolution(selected_pokemon, global_filter_config.level_cap)
+                    block = get_first_blocked_evolution(selected_pokemon, filter_config.level_cap)
                     if block:
                         st.warning(
                             f"{block['from_pokemon']} evolves into "
                             f"{block['to_pokemon']} at Level {block['level']}, "
                             f"but your level cap is "
-                            f"{global_filter_config.level_cap}."
+                            f"{filter_config.level_cap}."
                         )
 
                 st.subheader(f"Found in {len(filtered_rows)} location(s)")
@@ -995,6 +1014,10 @@ with tab3:
 
                 st.dataframe(table_data, width="stretch", hide_index=True)
 
+
+with tab3:
+    _render_location_search(global_filter_config)
+
 # Tab 4: Move Search
 with tab4:
     render_move_search_tab(global_filter_config)
@@ -1,65 +1,176 @@
 # ABOUTME: SQLite query functions for the Streamlit UI.
 # ABOUTME: Provides type/move search and data retrieval helpers.
 
+import atexit
+import json
+import re
 import sqlite3
+import threading
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from operator import itemgetter
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import streamlit as st
 
-from unbounddb.app.db import fetchall_to_dicts, get_connection
+from unbounddb.app.db import ConnectionPool, fetchall_column, fetchall_to_columns, fetchall_to_dicts
+from unbounddb.app.location_filters import LOCATION_FILTER_SQL, LocationFilterConfig
 from unbounddb.build.normalize import slugify
 from unbounddb.settings import settings
 
 if TYPE_CHECKING:
-    from unbounddb.app.location_filters import LocationFilterConfig
     from unbounddb.app.move_search_filters import MoveSearchFilters
 
+# Cost model: every query here reads a small, static SQLite file (a few thousand
+# rows per table), so time goes to per-call overhead, not computation: opening
+# connections, parsing SQL, Python<->SQLite round-trips and row conversion.
+# The levers that pay off, in order:
+#   1. Fewer round-trips: fuse per-item loops into one statement (recursive CTEs,
+#      json_each seeds) instead of issuing a query per Pokemon.
+#   2. No setup: connections come from a process-wide pool (_get_pool).
+#   3. No reparse: constant SQL text so the per-connection statement cache hits.
+#   4. No repeated work: public lookups are @st.cache_data, schema introspection
+#      is @st.cache_resource.
+# Vectorizing the Python post-processing cannot pay here; profile before trying.
+
+
+# Tables read by nearly every page; warmed in the background when a pool is created
+_HOT_TABLES = ("pokemon", "evolutions", "moves", "locations")
+
+
+# Bounds for st.cache_data on lookups whose arguments are open-ended, sized to
+# the working set: one entry per Pokemon/move key, per battle, or per filter
+# combination (searches hold the largest results, so keep the fewest).
+# Fixed-vocabulary helpers (type, move and location lists) stay unbounded.
+_LOOKUP_CACHE_ENTRIES = 2048
+_BATTLE_CACHE_ENTRIES = 256
+_SEARCH_CACHE_ENTRIES = 64
+
+
+# Pools created by _get_pool, so invalidation can close them without creating one
+_pools: dict[Path, ConnectionPool] = {}
+
+
+def _close_pools() -> None:
+    """Close and forget every pool created by _get_pool."""
+    while _pools:
+        _, pool = _pools.popitem()
+        pool.close()
+
+
+# One exit hook for all pools, so pools replaced after a rebuild are not pinned by it
+atexit.register(_close_pools)
+
 
 @st.cache_resource
-def _get_conn(db_path: Path | None = None) -> sqlite3.Connection:
-    """Get database connection with fallback to settings."""
+def _get_pool(db_path: Path) -> ConnectionPool:
+    """Get the process-wide connection pool for a database file, closed at interpreter exit.
+
+    Pools are recorded in _pools, which the module's exit hook closes. A new
+    pool starts warming the hot tables on a background thread, so the first
+    interaction after app boot does not pay for cold disk reads.
+    """
+    pool = ConnectionPool(db_path, max_size=settings.DB_POOL_SIZE)
+    _pools[db_path] = pool
+    threading.Thread(target=pool.warm, args=(_HOT_TABLES,), name="unbounddb-pool-warm", daemon=True).start()
+    return pool
+
+
+@contextmanager
+def _get_conn(db_path: Path | None = None) -> Iterator[sqlite3.Connection]:
+    """Borrow a pooled database connection with fallback to settings."""
     if db_path is None:
         db_path = settings.db_path
-    return get_connection(db_path)
+    with _get_pool(db_path).connection() as conn:
+        yield conn
 
 
-@st.cache_data
-def get_available_types(db_path: Path | None = None) -> list[str]:
-    """Get list of unique Pokemon types from the database.
+# Last seen modification time per database file, for rebuild detection
+_db_mtimes: dict[Path, int] = {}
+
+
+def invalidate_query_caches() -> None:
+    """Drop cached query results, this module's cached resources and pooled connections.
+
+    Game data results are cached by functions here and in the app tools, so
+    the whole st.cache_data store is cleared rather than each function one by
+    one. That also drops the cached user profiles, which simply reload from
+    the profile store on next use. Only pools that already exist are closed;
+    connections borrowed at the time are closed when they are returned.
+    """
+    _close_pools()
+    _get_pool.clear()
+    _table_names.clear()
+    _evolution_graph.clear()
+    st.cache_data.clear()
+
+
+def refresh_query_caches_if_rebuilt(db_path: Path | None = None) -> bool:
+    """Invalidate query caches if the database file changed since the last check.
+
+    Cheap enough (one stat call) to run on every script rerun, so a rebuild
+    while the UI is running is picked up without restarting Streamlit. A
+    rebuild removes the file before writing the new one; a check that lands
+    in between reports no change and the next rerun picks up the new file.
 
     Args:
         db_path: Optional path to database.
 
     Returns:
-        Sorted list of type names.
+        True if the caches were invalidated.
     """
-    conn = _get_conn(db_path)
-
-    # Try to find a type column in pokemon table
+    if db_path is None:
+        db_path = settings.db_path
     try:
-        columns = conn.execute("PRAGMA table_info('pokemon')").fetchall()
-        col_names = [c[1].lower() for c in columns]
+        mtime = db_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return False
+    if _db_mtimes.setdefault(db_path, mtime) == mtime:
+        return False
+    _db_mtimes[db_path] = mtime
+    invalidate_query_caches()
+    return True
 
-        # Look for type columns
-        type_cols = [c for c in col_names if "type" in c.lower()]
 
-        if not type_cols:
-            return []
+@st.cache_resource
+def _table_names(db_path: Path | None = None) -> tuple[str, ...]:
+    """Get names of all tables in the database, introspected once per process.
 
-        # Get unique values from first type column
-        type_col = type_cols[0]
-        # Column names come from schema introspection, not user input
-        result = conn.execute(
-            f"SELECT DISTINCT {type_col} FROM pokemon WHERE {type_col} IS NOT NULL ORDER BY 1"  # noqa: S608
-        ).fetchall()
+    Args:
+        db_path: Optional path to database.
+
+    Returns:
+        Tuple of table names.
+    """
+    with _get_conn(db_path) as conn:
+        cursor = conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
+        return tuple(fetchall_column(cursor))
 
-        return [r[0] for r in result if r[0]]
-    except Exception:
-        return []
 
+@st.cache_data(show_spinner=False)
+def get_available_types(db_path: Path | None = None) -> list[str]:
+    """Get list of unique Pokemon types from the database.
 
-@st.cache_data
+    Args:
+        db_path: Optional path to database.
+
+    Returns:
+        Sorted list of type names.
+    """
+    with _get_conn(db_path) as conn:
+        try:
+            cursor = conn.execute(
+                "SELECT DISTINCT type1 FROM pokemon WHERE type1 IS NOT NULL AND type1 <> '' ORDER BY 1"
+            )
+            return fetchall_column(cursor)
+        except Exception:
+            return []
+
+
+@st.cache_data(show_spinner=False)
 def get_available_moves(db_path: Path | None = None) -> list[str]:
     """Get list of unique move names from the database.
 
@@ -69,34 +180,49 @@ def get_available_moves(db_path: Path | None = None) -> list[str]:
     Returns:
         Sorted list of move names.
     """
-    conn = _get_conn(db_path)
-
-    try:
-        columns = conn.execute("PRAGMA table_info('moves')").fetchall()
-        col_names = [c[1].lower() for c in columns]
-
-        # Look for name column
-        name_candidates = ["name", "move", "move_name"]
-        name_col = None
-        for candidate in name_candidates:
-            if candidate in col_names:
-                name_col = candidate
-                break
-
-        if name_col is None:
+    with _get_conn(db_path) as conn:
+        try:
+            cursor = conn.execute("SELECT DISTINCT name FROM moves WHERE name IS NOT NULL AND name <> '' ORDER BY 1")
+            return fetchall_column(cursor)
+        except Exception:
             return []
 
-        # Column names come from schema introspection, not user input
-        result = conn.execute(
-            f"SELECT DISTINCT {name_col} FROM moves WHERE {name_col} IS NOT NULL ORDER BY 1"  # noqa: S608
-        ).fetchall()
 
-        return [r[0] for r in result if r[0]]
-    except Exception:
-        return []
+def _pokemon_search_query(filter_by_move: bool, filter_by_type: bool) -> str:
+    """Build the search_pokemon_by_type_and_move SQL for one filter shape.
+
+    Args:
+        filter_by_move: Whether to filter on a move the Pokemon learns (one ? parameter).
+        filter_by_type: Whether to filter on the Pokemon's primary type (one ? parameter).
+
+    Returns:
+        SQL text with ? placeholders, move parameter first.
+    """
+    conditions: list[str] = []
+
+    # Filter by move with a semi-join: a Pokemon learning the move several ways
+    # still yields one row, so no DISTINCT over the wide pokemon row is needed
+    if filter_by_move:
+        conditions.append("p.pokemon_key IN (SELECT pm.pokemon_key FROM pokemon_moves pm WHERE pm.move_key = ?)")
 
+    if filter_by_type:
+        conditions.append("p.type1 = ?")
 
-@st.cache_data
+    where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+    # Conditions are hardcoded constants, safe for f-string
+    return f"SELECT p.* FROM pokemon p{where} ORDER BY p.bst DESC"  # noqa: S608
+
+
+# One SQL string per filter shape (neither, move, type, both), built at import
+# so every search reuses verbatim text and hits sqlite3's statement cache
+_POKEMON_SEARCH_QUERIES = {
+    (by_move, by_type): _pokemon_search_query(by_move, by_type)
+    for by_move in (False, True)
+    for by_type in (False, True)
+}
+
+
+@st.cache_data(max_entries=_SEARCH_CACHE_ENTRIES, show_spinner=False)
 def search_pokemon_by_type_and_move(
     pokemon_type: str | None = None,
     move_name: str | None = None,
@@ -112,83 +238,48 @@ def search_pokemon_by_type_and_move(
     Returns:
         List of dicts with matching Pokemon.
     """
-    conn = _get_conn(db_path)
-
-    try:
-        # Get pokemon table columns to find type column
-        pokemon_cols = conn.execute("PRAGMA table_info('pokemon')").fetchall()
-        pokemon_col_names = [c[1] for c in pokemon_cols]
-        type_cols = [c for c in pokemon_col_names if "type" in c.lower()]
-
-        # Build query dynamically based on available tables and filters
-        tables_available = [t[0] for t in conn.execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall()]
-
-        # Start with base pokemon select
-        # Column names come from schema introspection, not user input
-        select_cols = ", ".join([f"p.{c}" for c in pokemon_col_names])
-        query = f"SELECT DISTINCT {select_cols} FROM pokemon p"  # noqa: S608
-        conditions: list[str] = []
-        params: list[str] = []
-
-        # Add pokemon_moves join if filtering by move
-        if move_name and "pokemon_moves" in tables_available:
-            query += " JOIN pokemon_moves pm ON p.pokemon_key = pm.pokemon_key"
-            conditions.append("pm.move_key = ?")
-            params.append(slugify(move_name))
-
-        # Add type filter
-        if pokemon_type and type_cols:
-            type_col = type_cols[0]
-            conditions.append(f"p.{type_col} = ?")
-            params.append(pokemon_type)
-
-        if conditions:
-            query += " WHERE " + " AND ".join(conditions)
-
-        # Order by BST if available, otherwise by name
-        bst_cols = [c for c in pokemon_col_names if "bst" in c.lower()]
-        if bst_cols:
-            query += f" ORDER BY p.{bst_cols[0]} DESC"
-        else:
-            name_cols = [c for c in pokemon_col_names if "name" in c.lower()]
-            if name_cols:
-                query += f" ORDER BY p.{name_cols[0]}"
-
+    # The move filter is dropped when the pokemon_moves table is missing
+    filter_by_move = bool(move_name) and "pokemon_moves" in _table_names(db_path)
+    filter_by_type = bool(pokemon_type)
+
+    params: list[str] = []
+    if filter_by_move and move_name:
+        params.append(slugify(move_name))
+    if filter_by_type and pokemon_type:
+        params.append(pokemon_type)
+
+    query = _POKEMON_SEARCH_QUERIES[filter_by_move, filter_by_type]
+    with _get_conn(db_path) as conn:
         cursor = conn.execute(query, params)
-        result = fetchall_to_dicts(cursor)
-        return result
+        return fetchall_to_dicts(cursor)
 
-    except Exception as e:
-        raise e
 
-
-@st.cache_data
-def get_table_preview(table_name: str, limit: int | None = 100, db_path: Path | None = None) -> list[dict[str, Any]]:
+@st.cache_data(max_entries=_SEARCH_CACHE_ENTRIES, show_spinner=False)
+def get_table_preview(table_name: str, limit: int | None = 100, db_path: Path | None = None) -> dict[str, list[Any]]:
     """Get a preview of a table's contents.
 
+    Results are column-oriented: full previews of large tables (pokemon_moves
+    has ~87k rows) are cached and re-pickled by Streamlit, and column lists
+    are much smaller than one dict per row.
+
     Args:
         table_name: Name of the table to preview.
         limit: Maximum rows to return. None for all rows.
         db_path: Optional path to database.
 
     Returns:
-        List of dicts with table contents.
+        Dict mapping column names to lists of values, ready for st.dataframe.
     """
-    conn = _get_conn(db_path)
-
-    try:
+    with _get_conn(db_path) as conn:
         # Table name comes from get_table_list() which queries the schema
         if limit is None:
             cursor = conn.execute(f"SELECT * FROM {table_name}")  # noqa: S608
         else:
             cursor = conn.execute(f"SELECT * FROM {table_name} LIMIT ?", [limit])  # noqa: S608
-        result = fetchall_to_dicts(cursor)
-        return result
-    except Exception as e:
-        raise e
+        return fetchall_to_columns(cursor)
 
 
-@st.cache_data
+@st.cache_data(show_spinner=False)
 def get_table_list(db_path: Path | None = None) -> list[str]:
     """Get list of available tables in the database.
 
@@ -198,16 +289,13 @@ def get_table_list(db_path: Path | None = None) -> list[str]:
     Returns:
         List of table names.
     """
-    conn = _get_conn(db_path)
-
     try:
-        tables = conn.execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall()
-        return [t[0] for t in tables]
+        return list(_table_names(db_path))
     except Exception:
         return []
 
 
-@st.cache_data
+@st.cache_data(show_spinner=False)
 def get_difficulties(db_path: Path | None = None) -> list[str]:
     """Get list of unique difficulty levels from battles table.
 
@@ -217,18 +305,17 @@ def get_difficulties(db_path: Path | None = None) -> list[str]:
     Returns:
         Sorted list of difficulty levels (excluding None).
     """
-    conn = _get_conn(db_path)
-
-    try:
-        result = conn.execute(
-            "SELECT DISTINCT difficulty FROM battles WHERE difficulty IS NOT NULL ORDER BY difficulty"
-        ).fetchall()
-        return [r[0] for r in result]
-    except Exception:
-        return []
+    with _get_conn(db_path) as conn:
+        try:
+            cursor = conn.execute(
+                "SELECT DISTINCT difficulty FROM battles WHERE difficulty IS NOT NULL ORDER BY difficulty"
+            )
+            return fetchall_column(cursor)
+        except Exception:
+            return []
 
 
-@st.cache_data
+@st.cache_data(max_entries=_BATTLE_CACHE_ENTRIES, show_spinner=False)
 def get_battles_by_difficulty(difficulty: str | None = None, db_path: Path | None = None) -> list[tuple[int, str]]:
     """Get list of (battle_id, name) tuples, optionally filtered by difficulty.
 
@@ -239,22 +326,24 @@ def get_battles_by_difficulty(difficulty: str | None = None, db_path: Path | Non
     Returns:
         List of (battle_id, name) tuples sorted by name.
     """
-    conn = _get_conn(db_path)
-
-    try:
-        if difficulty is None:
-            result = conn.execute("SELECT battle_id, name FROM battles ORDER BY name").fetchall()
-        else:
-            result = conn.execute(
-                "SELECT battle_id, name FROM battles WHERE difficulty = ? ORDER BY name",
-                [difficulty],
+    with _get_conn(db_path) as conn:
+        try:
+            # Rows already come back as (battle_id, name) tuples
+            return conn.execute(
+                "SELECT battle_id, name FROM battles"
+                " WHERE (:difficulty IS NULL OR difficulty = :difficulty) ORDER BY name",
+                {"difficulty": difficulty},
             ).fetchall()
-        return [(r[0], r[1]) for r in result]
-    except Exception:
-        return []
+        except Exception:
+            return []
 
 
-@st.cache_data
+_BATTLE_COLUMNS = ("battle_id", "name", "difficulty")
+# Column names are hardcoded constants, safe for f-string
+_BATTLE_BY_ID_QUERY = f"SELECT {', '.join(_BATTLE_COLUMNS)} FROM battles WHERE battle_id = ?"  # noqa: S608
+
+
+@st.cache_data(max_entries=_BATTLE_CACHE_ENTRIES, show_spinner=False)
 def get_battle_by_id(battle_id: int, db_path: Path | None = None) -> dict[str, str | None] | None:
     """Get battle details by ID.
 
@@ -265,25 +354,88 @@ def get_battle_by_id(battle_id: int, db_path: Path | None = None) -> dict[str, s
     Returns:
         Dictionary with battle details or None if not found.
     """
-    conn = _get_conn(db_path)
+    with _get_conn(db_path) as conn:
+        try:
+            result = conn.execute(_BATTLE_BY_ID_QUERY, [battle_id]).fetchone()
+            return dict(zip(_BATTLE_COLUMNS, result, strict=True)) if result else None
+        except Exception:
+            return None
 
-    try:
-        result = conn.execute(
-            "SELECT battle_id, name, difficulty FROM battles WHERE battle_id = ?",
-            [battle_id],
-        ).fetchone()
-        if result:
-            return {
-                "battle_id": result[0],
-                "name": result[1],
-                "difficulty": result[2],
-            }
-        return None
-    except Exception:
+
+# Battle row plus its team as a JSON array, so the header needs one round-trip.
+# json_group_array does not promise to keep a subquery's ORDER BY (ordered
+# aggregates need SQLite 3.44), so the caller sorts the team by slot.
+_BATTLE_WITH_TEAM_QUERY = """
+    SELECT
+        b.battle_id,
+        b.name,
+        b.difficulty,
+        (
+            SELECT json_group_array(
+                json_object('slot', t.slot, 'pokemon_key', t.pokemon_key, 'type1', t.type1, 'type2', t.type2)
+            )
+            FROM (
+                SELECT tp.slot, tp.pokemon_key, p.type1, p.type2
+                FROM battle_pokemon tp
+                JOIN pokemon p ON tp.pokemon_key = p.pokemon_key
+                WHERE tp.battle_id = b.battle_id
+            ) t
+        ) AS team
+    FROM battles b
+    WHERE b.battle_id = ?
+"""
+
+
+@st.cache_data(max_entries=_BATTLE_CACHE_ENTRIES, show_spinner=False)
+def get_battle_with_team(battle_id: int, db_path: Path | None = None) -> dict[str, Any] | None:
+    """Get battle details and its team's Pokemon types in a single query.
+
+    Combines get_battle_by_id and get_battle_pokemon_types for callers that
+    need both, such as the battle header.
+
+    Args:
+        battle_id: ID of the battle.
+        db_path: Optional path to database.
+
+    Returns:
+        Dict with "battle" (battle_id, name, difficulty) and "team" (list of dicts
+        with slot, pokemon_key, type1, type2 in slot order), or None if not found.
+    """
+    with _get_conn(db_path) as conn:
+        try:
+            result = conn.execute(_BATTLE_WITH_TEAM_QUERY, [battle_id]).fetchone()
+        except Exception:
+            return None
+    if result is None:
         return None
+    team = json.loads(result[3])
+    team.sort(key=itemgetter("slot"))
+    return {
+        "battle": dict(zip(_BATTLE_COLUMNS, result[:3], strict=True)),
+        "team": team,
+    }
+
+
+_BATTLE_TEAM_QUERY = """
+    SELECT
+        tp.pokemon_key,
+        tp.slot,
+        p.type1 AS pokemon_type1,
+        p.type2 AS pokemon_type2,
+        tpm.move_key,
+        m.name AS move_name,
+        m.type AS move_type,
+        m.category AS move_category
+    FROM battle_pokemon tp
+    JOIN pokemon p ON tp.pokemon_key = p.pokemon_key
+    JOIN battle_pokemon_moves tpm ON tp.id = tpm.battle_pokemon_id
+    JOIN moves m ON tpm.move_key = m.move_key
+    WHERE tp.battle_id = ?
+    ORDER BY tp.slot, tpm.slot
+"""
 
 
-@st.cache_data
+@st.cache_data(max_entries=_BATTLE_CACHE_ENTRIES, show_spinner=False)
 def get_battle_team_with_moves(battle_id: int, db_path: Path | None = None) -> list[dict[str, Any]]:
     """Get a battle's full team with Pokemon types and move details.
 
@@ -297,37 +449,129 @@ def get_battle_team_with_moves(battle_id: int, db_path: Path | None = None) -> l
     Returns:
         List of dicts with battle's team and move information.
     """
-    conn = _get_conn(db_path)
-
-    query = """
-        SELECT
-            tp.pokemon_key,
-            tp.slot,
-            p.type1 AS pokemon_type1,
-            p.type2 AS pokemon_type2,
-            tpm.move_key,
-            m.name AS move_name,
-            m.type AS move_type,
-            m.category AS move_category
-        FROM battle_pokemon tp
-        JOIN pokemon p ON tp.pokemon_key = p.pokemon_key
-        JOIN battle_pokemon_moves tpm ON tp.id = tpm.battle_pokemon_id
-        JOIN moves m ON tpm.move_key = m.move_key
-        WHERE tp.battle_id = ?
-        ORDER BY tp.slot, tpm.slot
+    with _get_conn(db_path) as conn:
+        cursor = conn.execute(_BATTLE_TEAM_QUERY, [battle_id])
+        return fetchall_to_dicts(cursor)
+
+
+# Evolution edge as stored in the graph: (other Pokemon name, method, condition)
+_EvolutionEdge = tuple[str, str | None, str | None]
+
+
+@dataclass(frozen=True)
+class _EvolutionGraph:
+    """Evolutions table indexed by lowercase Pokemon name in both directions.
+
+    Attributes:
+        forward: Lowercase from_pokemon -> edges to each evolution, in table order.
+        backward: Lowercase to_pokemon -> edges to each pre-evolution, in table order.
     """
 
-    try:
-        cursor = conn.execute(query, [battle_id])
-        result = fetchall_to_dicts(cursor)
-        return result
-    except Exception as e:
-        raise e
+    forward: dict[str, tuple[_EvolutionEdge, ...]]
+    backward: dict[str, tuple[_EvolutionEdge, ...]]
+
+
+@st.cache_resource
+def _evolution_graph(db_path: Path | None = None) -> _EvolutionGraph:
+    """Load the evolutions table once per process as an in-memory graph.
+
+    The table holds a few hundred rows and never changes after a build, so
+    walking it in Python avoids a recursive query per lookup.
+
+    Args:
+        db_path: Optional path to database.
+
+    Returns:
+        Evolution graph; empty if the evolutions table is missing.
+    """
+    forward: dict[str, list[_EvolutionEdge]] = {}
+    backward: dict[str, list[_EvolutionEdge]] = {}
+    with _get_conn(db_path) as conn:
+        try:
+            cursor = conn.execute("SELECT from_pokemon, to_pokemon, method, condition FROM evolutions")
+            for from_pokemon, to_pokemon, method, condition in cursor:
+                forward.setdefault(from_pokemon.lower(), []).append((to_pokemon, method, condition))
+                backward.setdefault(to_pokemon.lower(), []).append((from_pokemon, method, condition))
+        except Exception:
+            forward, backward = {}, {}
+    return _EvolutionGraph(
+        forward={k: tuple(v) for k, v in forward.items()},
+        backward={k: tuple(v) for k, v in backward.items()},
+    )
 
 
-@st.cache_data
+def _evolution_level(condition: str | None) -> int | None:
+    """Parse the level of a level-based evolution condition.
+
+    Mirrors the SQL "CASE WHEN condition GLOB '[0-9]*' THEN CAST(condition AS INTEGER)"
+    used by the recursive queries: the leading digits, or None.
+
+    Args:
+        condition: Evolution condition, e.g. "16".
+
+    Returns:
+        Leading integer of the condition, or None if it does not start with a digit.
+    """
+    if not condition:
+        return None
+    match = re.match(r"\d+", str(condition))
+    return int(match.group()) if match else None
+
+
+def _within_level_cap(method: str | None, condition: str | None, level_cap: int | None) -> bool:
+    """Check whether an evolution step can happen at or below the level cap.
+
+    Level-based evolutions (method = 'Level') must have condition <= level_cap.
+    Non-level evolutions (Stone, Trade, etc.) and a None level_cap always pass.
+
+    Args:
+        method: Evolution method.
+        condition: Evolution condition.
+        level_cap: Maximum level, or None for no cap.
+
+    Returns:
+        True if the step is reachable under the cap.
+    """
+    if level_cap is None or (method is not None and method != "Level"):
+        return True
+    level = _evolution_level(condition)
+    return level is None or level <= level_cap
+
+
+def _walk_evolutions(
+    start: str,
+    edges: dict[str, tuple[_EvolutionEdge, ...]],
+    level_cap: int | None = None,
+) -> list[str]:
+    """Breadth-first walk of the evolution graph from a Pokemon.
+
+    Each Pokemon is visited once, so cyclic forms (e.g. Necrozma's) terminate.
+
+    Args:
+        start: Pokemon name to start from (case-insensitive).
+        edges: Adjacency map to follow (forward or backward).
+        level_cap: If set, skip level-based steps above this level.
+
+    Returns:
+        Reached Pokemon names ordered from closest to furthest, excluding start.
+    """
+    seen = {start.lower()}
+    queue = deque([start.lower()])
+    reached: list[str] = []
+    while queue:
+        for name, method, condition in edges.get(queue.popleft(), ()):
+            key = name.lower()
+            if key in seen or not _within_level_cap(method, condition, level_cap):
+                continue
+            seen.add(key)
+            reached.append(name)
+            queue.append(key)
+    return reached
+
+
+@st.cache_data(max_entries=_LOOKUP_CACHE_ENTRIES, show_spinner=False)
 def get_pre_evolutions(pokemon_name: str, db_path: Path | None = None) -> list[str]:
-    """Get all pre-evolutions of a Pokemon using recursive CTE.
+    """Get all pre-evolutions of a Pokemon from the in-memory evolution graph.
 
     Walks the evolution chain backwards to find all Pokemon that eventually
     evolve into the given Pokemon.
@@ -341,37 +585,16 @@ def get_pre_evolutions(pokemon_name: str, db_path: Path | None = None) -> list[s
         For "Charizard" returns ["Charmeleon", "Charmander"].
         For Pokemon with no pre-evolutions returns [].
     """
-    conn = _get_conn(db_path)
+    return _walk_evolutions(pokemon_name, _evolution_graph(db_path).backward)
 
-    query = """
-    WITH RECURSIVE pre_evos AS (
-        SELECT from_pokemon, to_pokemon
-        FROM evolutions
-        WHERE LOWER(to_pokemon) = LOWER(?)
 
-        UNION ALL
-
-        SELECT e.from_pokemon, e.to_pokemon
-        FROM evolutions e
-        JOIN pre_evos p ON LOWER(e.to_pokemon) = LOWER(p.from_pokemon)
-    )
-    SELECT DISTINCT from_pokemon FROM pre_evos
-    """
-
-    try:
-        result = conn.execute(query, [pokemon_name]).fetchall()
-        return [r[0] for r in result]
-    except Exception:
-        return []
-
-
-@st.cache_data
+@st.cache_data(max_entries=_LOOKUP_CACHE_ENTRIES, show_spinner=False)
 def get_all_evolutions(
     pokemon_name: str,
     db_path: Path | None = None,
     level_cap: int | None = None,
 ) -> list[str]:
-    """Get all evolutions of a Pokemon using recursive CTE.
+    """Get all evolutions of a Pokemon from the in-memory evolution graph.
 
     Walks the evolution chain forward to find all Pokemon that the given
     Pokemon eventually evolves into. If level_cap is provided, only includes
@@ -388,63 +611,10 @@ def get_all_evolutions(
         For "Charmander" returns ["Charmeleon", "Charizard"] (or fewer with level_cap).
         For Pokemon with no evolutions returns [].
     """
-    conn = _get_conn(db_path)
-
-    if level_cap is None:
-        # No level cap - return all evolutions
-        query = """
-        WITH RECURSIVE evos AS (
-            SELECT from_pokemon, to_pokemon
-            FROM evolutions
-            WHERE LOWER(from_pokemon) = LOWER(?)
-
-            UNION ALL
-
-            SELECT e.from_pokemon, e.to_pokemon
-            FROM evolutions e
-            JOIN evos ev ON LOWER(e.from_pokemon) = LOWER(ev.to_pokemon)
-        )
-        SELECT DISTINCT to_pokemon FROM evos
-        """
-        params: list[str | int] = [pokemon_name]
-    else:
-        # With level cap - only include evolutions achievable at or below level_cap
-        # Level-based evolutions (method = 'Level') must have condition <= level_cap
-        # Non-level evolutions (Stone, Trade, etc.) are always included
-        query = """
-        WITH RECURSIVE evos AS (
-            SELECT from_pokemon, to_pokemon, method, condition
-            FROM evolutions
-            WHERE LOWER(from_pokemon) = LOWER(?)
-            AND (
-                method != 'Level'
-                OR CASE WHEN condition GLOB '[0-9]*' THEN CAST(condition AS INTEGER) ELSE NULL END IS NULL
-                OR CASE WHEN condition GLOB '[0-9]*' THEN CAST(condition AS INTEGER) ELSE NULL END <= ?
-            )
-
-            UNION ALL
+    return _walk_evolutions(pokemon_name, _evolution_graph(db_path).forward, level_cap)
 
-            SELECT e.from_pokemon, e.to_pokemon, e.method, e.condition
-            FROM evolutions e
-            JOIN evos ev ON LOWER(e.from_pokemon) = LOWER(ev.to_pokemon)
-            WHERE (
-                e.method != 'Level'
-                OR CASE WHEN e.condition GLOB '[0-9]*' THEN CAST(e.condition AS INTEGER) ELSE NULL END IS NULL
-                OR CASE WHEN e.condition GLOB '[0-9]*' THEN CAST(e.condition AS INTEGER) ELSE NULL END <= ?
-            )
-        )
-        SELECT DISTINCT to_pokemon FROM evos
-        """
-        params = [pokemon_name, level_cap, level_cap]
 
-    try:
-        result = conn.execute(query, params).fetchall()
-        return [r[0] for r in result]
-    except Exception:
-        return []
-
-
-@st.cache_data
+@st.cache_data(max_entries=_LOOKUP_CACHE_ENTRIES, show_spinner=False)
 def get_first_blocked_evolution(
     pokemon_name: str,
     level_cap: int,
@@ -454,7 +624,10 @@ def get_first_blocked_evolution(
 
     Walks backward through the evolution chain from the searched Pokemon
     and finds the step closest to the base form where method is 'Level'
-    and condition exceeds the level cap.
+    and condition exceeds the level cap. Every path is followed, so a step
+    reachable along several paths counts at its longest distance from the
+    searched Pokemon; a path stops at a Pokemon it already passed through,
+    so cyclic forms terminate.
 
     Args:
         pokemon_name: The evolved Pokemon name to check (case-insensitive).
@@ -465,51 +638,76 @@ def get_first_blocked_evolution(
         Dict with from_pokemon, to_pokemon, level if a blocked step exists,
         or None if no evolution step is blocked by the level cap.
     """
-    conn = _get_conn(db_path)
+    graph = _evolution_graph(db_path)
+    start = pokemon_name.lower()
+    # Paths as (last Pokemon, depth, Pokemon on the path); chains are a few steps long
+    queue = deque([(start, 1, frozenset([start]))])
+    # Deepest blocked step so far as (depth, from_pokemon, lowercase to_pokemon, level)
+    blocked: tuple[int, str, str, int] | None = None
+    while queue:
+        key, depth, path = queue.popleft()
+        for from_pokemon, method, condition in graph.backward.get(key, ()):
+            level = _evolution_level(condition) if method == "Level" else None
+            if level is not None and level > level_cap and (blocked is None or depth > blocked[0]):
+                blocked = (depth, from_pokemon, key, level)
+            from_key = from_pokemon.lower()
+            if from_key not in path:
+                queue.append((from_key, depth + 1, path | {from_key}))
+
+    if blocked is None:
+        return None
+    _, from_pokemon, to_key, level = blocked
+    # Report the evolution's name as stored, not as typed by the caller
+    to_pokemon = next(name for name, _, _ in graph.forward[from_pokemon.lower()] if name.lower() == to_key)
+    return {"from_pokemon": from_pokemon, "to_pokemon": to_pokemon, "level": level}
+
 
-    query = """
-    WITH RECURSIVE chain AS (
-        SELECT from_pokemon, to_pokemon, method, condition, 1 as depth
-        FROM evolutions
-        WHERE LOWER(to_pokemon) = LOWER(?)
+# Seeds the catchable Pokemon, then walks evolutions forward. Level-based
+# evolutions above the level cap stop the chain; non-level evolutions and a
+# NULL cap always pass. The level is parsed once per row: a condition without a
+# leading number compares as NULL, which COALESCE turns into a pass. Blank or
+# NULL evolution targets are never added.
+_AVAILABLE_POKEMON_TEMPLATE = """
+    WITH RECURSIVE available(name) AS (
+        {seed}
 
-        UNION ALL
+        UNION
 
-        SELECT e.from_pokemon, e.to_pokemon, e.method, e.condition, c.depth + 1
+        SELECT e.to_pokemon
         FROM evolutions e
-        JOIN chain c ON LOWER(e.to_pokemon) = LOWER(c.from_pokemon)
+        JOIN available a ON LOWER(e.from_pokemon) = LOWER(a.name)
+        WHERE e.to_pokemon <> ''
+          AND (
+              :level_cap IS NULL
+              OR e.method != 'Level'
+              OR COALESCE(CASE WHEN e.condition GLOB '[0-9]*' THEN CAST(e.condition AS INTEGER) END <= :level_cap, 1)
+          )
     )
-    SELECT from_pokemon, to_pokemon,
-           CASE WHEN condition GLOB '[0-9]*' THEN CAST(condition AS INTEGER) ELSE NULL END as level
-    FROM chain
-    WHERE method = 'Level'
-      AND CASE WHEN condition GLOB '[0-9]*' THEN CAST(condition AS INTEGER) ELSE NULL END > ?
-    ORDER BY depth DESC
-    LIMIT 1
-    """
+    SELECT name FROM available
+"""
 
-    try:
-        result = conn.execute(query, [pokemon_name, level_cap]).fetchone()
-        if result is None:
-            return None
-        return {
-            "from_pokemon": result[0],
-            "to_pokemon": result[1],
-            "level": result[2],
-        }
-    except Exception:
-        return None
+# Seeded from the catch locations that pass the game-progress filters, bound
+# with LocationFilterConfig.sql_params(); the filter SQL is a hardcoded constant
+_AVAILABLE_POKEMON_QUERY = _AVAILABLE_POKEMON_TEMPLATE.format(
+    seed=f"SELECT pokemon FROM locations WHERE pokemon IS NOT NULL AND pokemon <> '' AND {LOCATION_FILTER_SQL}"  # noqa: S608
+)
 
+# Seeded from every catch location, for configs whose location filters accept all rows
+_ALL_AVAILABLE_POKEMON_QUERY = _AVAILABLE_POKEMON_TEMPLATE.format(
+    seed="SELECT pokemon FROM locations WHERE pokemon IS NOT NULL AND pokemon <> ''"
+)
 
-@st.cache_data
+
+@st.cache_data(max_entries=_SEARCH_CACHE_ENTRIES, show_spinner=False)
 def get_available_pokemon_set(
-    filter_config: "LocationFilterConfig | None",
+    filter_config: LocationFilterConfig | None,
     db_path: Path | None = None,
 ) -> frozenset[str] | None:
     """Get set of Pokemon names available given game progress filters.
 
     Returns Pokemon whose pre-evolution chain has at least one catch location
     passing the filters. Also includes all evolutions of catchable Pokemon.
+    The location filters and the evolution walk run in a single query.
 
     Args:
         filter_config: Configuration for location filtering based on game progress.
@@ -522,43 +720,21 @@ def get_available_pokemon_set(
     if filter_config is None:
         return None
 
-    # Import here to avoid circular import
-    from unbounddb.app.location_filters import apply_location_filters  # noqa: PLC0415
-
-    conn = _get_conn(db_path)
-
-    # Get all locations from DB
-    try:
-        cursor = conn.execute(
-            "SELECT pokemon, location_name, encounter_method, encounter_notes, requirement FROM locations"
-        )
-        all_locations = fetchall_to_dicts(cursor)
-    except Exception:
-        return frozenset()
-
-    if not all_locations:
-        return frozenset()
-
-    # Apply game progress filters
-    filtered = apply_location_filters(all_locations, filter_config)
-
-    if not filtered:
-        return frozenset()
-
-    # Get base catchable Pokemon
-    catchable = {r["pokemon"] for r in filtered}
-
-    # Add all evolutions of catchable Pokemon (respecting level cap)
-    available: set[str] = set()
-    for pokemon in catchable:
-        available.add(pokemon)
-        evolutions = get_all_evolutions(pokemon, db_path, level_cap=filter_config.level_cap)
-        available.update(evolutions)
+    # Every location passes: skip evaluating the filter predicates
+    if filter_config.is_passthrough():
+        query, params = _ALL_AVAILABLE_POKEMON_QUERY, {}
+    else:
+        query, params = _AVAILABLE_POKEMON_QUERY, filter_config.sql_params()
 
-    return frozenset(available)
+    with _get_conn(db_path) as conn:
+        try:
+            cursor = conn.execute(query, {**params, "level_cap": filter_config.level_cap})
+            return frozenset(fetchall_column(cursor))
+        except Exception:
+            return frozenset()
 
 
-@st.cache_data
+@st.cache_data(show_spinner=False)
 def get_all_location_names(db_path: Path | None = None) -> list[str]:
     """Get sorted list of unique location names from the locations table.
 
@@ -568,18 +744,18 @@ def get_all_location_names(db_path: Path | None = None) -> list[str]:
     Returns:
         Sorted list of unique location names.
     """
-    conn = _get_conn(db_path)
-
-    try:
-        result = conn.execute(
-            "SELECT DISTINCT location_name FROM locations WHERE location_name IS NOT NULL ORDER BY location_name"
-        ).fetchall()
-        return [r[0] for r in result if r[0]]
-    except Exception:
-        return []
+    with _get_conn(db_path) as conn:
+        try:
+            cursor = conn.execute(
+                "SELECT DISTINCT location_name FROM locations "
+                "WHERE location_name IS NOT NULL AND location_name <> '' ORDER BY location_name"
+            )
+            return fetchall_column(cursor)
+        except Exception:
+            return []
 
 
-@st.cache_data
+@st.cache_data(show_spinner=False)
 def get_all_pokemon_names_from_locations(db_path: Path | None = None) -> list[str]:
     """Get sorted list of Pokemon names obtainable from catch locations.
 
@@ -592,38 +768,27 @@ def get_all_pokemon_names_from_locations(db_path: Path | None = None) -> list[st
     Returns:
         Sorted list of unique Pokemon names (catchable + evolutions).
     """
-    conn = _get_conn(db_path)
+    with _get_conn(db_path) as conn:
+        try:
+            # Same closure as get_available_pokemon_set with no filters and no level cap;
+            # sharing the SQL text lets both reuse one cached prepared statement
+            cursor = conn.execute(_ALL_AVAILABLE_POKEMON_QUERY, {"level_cap": None})
+            return sorted(fetchall_column(cursor))
+        except Exception:
+            return []
 
-    try:
-        # Use recursive CTE to find all evolutions of catchable Pokemon
-        result = conn.execute(
-            """
-            WITH RECURSIVE
-            -- Base: all Pokemon directly in locations table
-            catchable AS (
-                SELECT DISTINCT pokemon FROM locations WHERE pokemon IS NOT NULL
-            ),
-            -- Recursive: find all evolutions of catchable Pokemon
-            all_evolutions AS (
-                -- Start with catchable Pokemon
-                SELECT pokemon AS name FROM catchable
-
-                UNION
-
-                -- Add evolutions of Pokemon we've found so far
-                SELECT e.to_pokemon AS name
-                FROM evolutions e
-                JOIN all_evolutions ae ON LOWER(e.from_pokemon) = LOWER(ae.name)
-            )
-            SELECT DISTINCT name FROM all_evolutions ORDER BY name
-            """
-        ).fetchall()
-        return [r[0] for r in result if r[0]]
-    except Exception:
-        return []
+
+# Locations for a JSON array of lowercase Pokemon names; matches the
+# idx_locations_pokemon_lower expression index
+_LOCATIONS_BY_NAMES_QUERY = """
+    SELECT pokemon, location_name, encounter_method, encounter_notes, requirement
+    FROM locations
+    WHERE LOWER(pokemon) IN (SELECT value FROM json_each(?))
+    ORDER BY pokemon, location_name, encounter_method
+"""
 
 
-@st.cache_data
+@st.cache_data(max_entries=_LOOKUP_CACHE_ENTRIES, show_spinner=False)
 def search_pokemon_locations(pokemon_name: str, db_path: Path | None = None) -> list[dict[str, Any]]:
     """Search for all locations where a Pokemon or its pre-evolutions can be caught.
 
@@ -640,30 +805,22 @@ def search_pokemon_locations(pokemon_name: str, db_path: Path | None = None) ->
         encounter_notes, requirement. The pokemon column shows which Pokemon
         actually spawns at that location.
     """
-    # Get all pre-evolutions
-    pre_evos = get_pre_evolutions(pokemon_name, db_path)
-    all_pokemon = [pokemon_name, *pre_evos]
+    # Pre-evolutions come from the cached graph, whose keys were lowercased once
+    # at load time; the indexed LOWER(pokemon) lookup is the only per-call LOWER.
+    pre_evolutions = _walk_evolutions(pokemon_name, _evolution_graph(db_path).backward)
+    names_lc = [pokemon_name.lower(), *(name.lower() for name in pre_evolutions)]
 
-    conn = _get_conn(db_path)
+    with _get_conn(db_path) as conn:
+        cursor = conn.execute(_LOCATIONS_BY_NAMES_QUERY, [json.dumps(names_lc)])
+        return fetchall_to_dicts(cursor)
 
-    try:
-        # Build parameterized query for all Pokemon in the chain
-        placeholders = ", ".join(["LOWER(?)" for _ in all_pokemon])
-        query = f"""
-            SELECT pokemon, location_name, encounter_method, encounter_notes, requirement
-            FROM locations
-            WHERE LOWER(pokemon) IN ({placeholders})
-            ORDER BY pokemon, location_name, encounter_method
-        """  # noqa: S608
-
-        cursor = conn.execute(query, all_pokemon)
-        result = fetchall_to_dicts(cursor)
-        return result
-    except Exception as e:
-        raise e
-
-
-@st.cache_data
+
+_MOVE_DETAIL_COLUMNS = ("name", "type", "category", "power", "accuracy", "pp", "priority", "effect")
+# Column names are hardcoded constants, safe for f-string
+_MOVE_DETAILS_QUERY = f"SELECT {', '.join(_MOVE_DETAIL_COLUMNS)} FROM moves WHERE move_key = ?"  # noqa: S608
+
+
+@st.cache_data(max_entries=_LOOKUP_CACHE_ENTRIES, show_spinner=False)
 def get_move_details(move_key: str, db_path: Path | None = None) -> dict[str, str | int | None] | None:
     """Get full details for a move.
 
@@ -675,35 +832,66 @@ def get_move_details(move_key: str, db_path: Path | None = None) -> dict[str, st
         Dictionary with move details or None if not found.
         Keys: name, type, category, power, accuracy, pp, priority, effect
     """
-    conn = _get_conn(db_path)
+    with _get_conn(db_path) as conn:
+        try:
+            result = conn.execute(_MOVE_DETAILS_QUERY, [move_key]).fetchone()
+            return dict(zip(_MOVE_DETAIL_COLUMNS, result, strict=True)) if result else None
+        except Exception:
+            return None
+
+
+# Column names are hardcoded constants, safe for f-string
+_MOVE_DETAILS_MANY_QUERY = (
+    f"SELECT move_key, {', '.join(_MOVE_DETAIL_COLUMNS)} FROM moves "  # noqa: S608
+    "WHERE move_key IN (SELECT value FROM json_each(?))"
+)
 
-    try:
-        result = conn.execute(
-            """
-            SELECT name, type, category, power, accuracy, pp, priority, effect
-            FROM moves
-            WHERE move_key = ?
-            """,
-            [move_key],
-        ).fetchone()
-
-        if result:
-            return {
-                "name": result[0],
-                "type": result[1],
-                "category": result[2],
-                "power": result[3],
-                "accuracy": result[4],
-                "pp": result[5],
-                "priority": result[6],
-                "effect": result[7],
-            }
-        return None
-    except Exception:
-        return None
 
+@st.cache_data(max_entries=_SEARCH_CACHE_ENTRIES, show_spinner=False)
+def get_move_details_many(
+    move_keys: tuple[str, ...],
+    db_path: Path | None = None,
+) -> dict[str, dict[str, str | int | None]]:
+    """Get full details for several moves in one query.
+
+    Args:
+        move_keys: Slugified move keys to look up.
+        db_path: Optional path to database.
 
-@st.cache_data
+    Returns:
+        Dict mapping each found move_key to the same details dict as get_move_details.
+        Keys that are not found are absent.
+    """
+    if not move_keys:
+        return {}
+    with _get_conn(db_path) as conn:
+        try:
+            cursor = conn.execute(_MOVE_DETAILS_MANY_QUERY, [json.dumps(move_keys)])
+            return {row[0]: dict(zip(_MOVE_DETAIL_COLUMNS, row[1:], strict=True)) for row in cursor}
+        except Exception:
+            return {}
+
+
+_POKEMON_DETAIL_COLUMNS = (
+    "name",
+    "hp",
+    "attack",
+    "defense",
+    "sp_attack",
+    "sp_defense",
+    "speed",
+    "bst",
+    "type1",
+    "type2",
+    "ability1",
+    "ability2",
+    "hidden_ability",
+)
+# Column names are hardcoded constants, safe for f-string
+_POKEMON_DETAILS_QUERY = f"SELECT {', '.join(_POKEMON_DETAIL_COLUMNS)} FROM pokemon WHERE pokemon_key = ?"  # noqa: S608
+
+
+@st.cache_data(max_entries=_LOOKUP_CACHE_ENTRIES, show_spinner=False)
 def get_pokemon_details(pokemon_key: str, db_path: Path | None = None) -> dict[str, str | int | None] | None:
     """Get full stats for a Pokemon.
 
@@ -716,41 +904,47 @@ def get_pokemon_details(pokemon_key: str, db_path: Path | None = None) -> dict[s
         Keys: name, hp, attack, defense, sp_attack, sp_defense, speed, bst,
               type1, type2, ability1, ability2, hidden_ability
     """
-    conn = _get_conn(db_path)
+    with _get_conn(db_path) as conn:
+        try:
+            result = conn.execute(_POKEMON_DETAILS_QUERY, [pokemon_key]).fetchone()
+            return dict(zip(_POKEMON_DETAIL_COLUMNS, result, strict=True)) if result else None
+        except Exception:
+            return None
 
-    try:
-        result = conn.execute(
-            """
-            SELECT name, hp, attack, defense, sp_attack, sp_defense, speed, bst,
-                   type1, type2, ability1, ability2, hidden_ability
-            FROM pokemon
-            WHERE pokemon_key = ?
-            """,
-            [pokemon_key],
-        ).fetchone()
-
-        if result:
-            return {
-                "name": result[0],
-                "hp": result[1],
-                "attack": result[2],
-                "defense": result[3],
-                "sp_attack": result[4],
-                "sp_defense": result[5],
-                "speed": result[6],
-                "bst": result[7],
-                "type1": result[8],
-                "type2": result[9],
-                "ability1": result[10],
-                "ability2": result[11],
-                "hidden_ability": result[12],
-            }
-        return None
-    except Exception:
-        return None
 
+# Column names are hardcoded constants, safe for f-string
+_POKEMON_DETAILS_MANY_QUERY = (
+    f"SELECT pokemon_key, {', '.join(_POKEMON_DETAIL_COLUMNS)} FROM pokemon "  # noqa: S608
+    "WHERE pokemon_key IN (SELECT value FROM json_each(?))"
+)
+
+
+@st.cache_data(max_entries=_SEARCH_CACHE_ENTRIES, show_spinner=False)
+def get_pokemon_details_many(
+    pokemon_keys: tuple[str, ...],
+    db_path: Path | None = None,
+) -> dict[str, dict[str, str | int | None]]:
+    """Get full stats for several Pokemon in one query.
 
-@st.cache_data
+    Args:
+        pokemon_keys: Slugified pokemon keys to look up.
+        db_path: Optional path to database.
+
+    Returns:
+        Dict mapping each found pokemon_key to the same details dict as get_pokemon_details.
+        Keys that are not found are absent.
+    """
+    if not pokemon_keys:
+        return {}
+    with _get_conn(db_path) as conn:
+        try:
+            cursor = conn.execute(_POKEMON_DETAILS_MANY_QUERY, [json.dumps(pokemon_keys)])
+            return {row[0]: dict(zip(_POKEMON_DETAIL_COLUMNS, row[1:], strict=True)) for row in cursor}
+        except Exception:
+            return {}
+
+
+@st.cache_data(max_entries=_SEARCH_CACHE_ENTRIES, show_spinner=False)
 def get_pokemon_by_type(
     type_name: str,
     available_pokemon: frozenset[str] | None = None,
@@ -767,30 +961,39 @@ def get_pokemon_by_type(
         List of dicts with columns: name, type1, type2, bst, pokemon_key
         Sorted by bst descending.
     """
-    conn = _get_conn(db_path)
-
-    try:
+    # The available-set filter is applied in SQL, not on the fetched rows; the
+    # IN subquery is order-independent, so the set is encoded without sorting
+    available = None if available_pokemon is None else json.dumps(list(available_pokemon))
+    with _get_conn(db_path) as conn:
         cursor = conn.execute(
             """
             SELECT name, type1, type2, bst, pokemon_key
             FROM pokemon
-            WHERE type1 = ? OR type2 = ?
+            WHERE (type1 = :type_name OR type2 = :type_name)
+              AND (:available IS NULL OR name IN (SELECT value FROM json_each(:available)))
             ORDER BY bst DESC
             """,
-            [type_name, type_name],
+            {"type_name": type_name, "available": available},
         )
-        result = fetchall_to_dicts(cursor)
+        return fetchall_to_dicts(cursor)
 
-        # Filter by available Pokemon if provided
-        if available_pokemon is not None and result:
-            result = [r for r in result if r["name"] in available_pokemon]
 
-        return result
-    except Exception as e:
-        raise e
+_POKEMON_LEARNSET_QUERY = """
+    SELECT
+        m.name AS move_name,
+        m.type AS move_type,
+        m.category,
+        m.power,
+        pm.learn_method,
+        pm.level
+    FROM pokemon_moves pm
+    JOIN moves m ON pm.move_key = m.move_key
+    WHERE pm.pokemon_key = ?
+    ORDER BY pm.learn_method, pm.level, m.name
+"""
 
 
-@st.cache_data
+@st.cache_data(max_entries=_LOOKUP_CACHE_ENTRIES, show_spinner=False)
 def get_pokemon_learnset(pokemon_key: str, db_path: Path | None = None) -> list[dict[str, Any]]:
     """Get complete learnset for a Pokemon.
 
@@ -802,29 +1005,25 @@ def get_pokemon_learnset(pokemon_key: str, db_path: Path | None = None) -> list[
         List of dicts with columns: move_name, move_type, category, power, learn_method, level
         Sorted by learn_method and level.
     """
-    conn = _get_conn(db_path)
+    with _get_conn(db_path) as conn:
+        cursor = conn.execute(_POKEMON_LEARNSET_QUERY, [pokemon_key])
+        return fetchall_to_dicts(cursor)
 
-    try:
-        cursor = conn.execute(
-            """
-            SELECT
-                m.name AS move_name,
-                m.type AS move_type,
-                m.category,
-                m.power,
-                pm.learn_method,
-                pm.level
-            FROM pokemon_moves pm
-            JOIN moves m ON pm.move_key = m.move_key
-            WHERE pm.pokemon_key = ?
-            ORDER BY pm.learn_method, pm.level, m.name
-            """,
-            [pokemon_key],
-        )
-        result = fetchall_to_dicts(cursor)
-        return result
-    except Exception as e:
-        raise e
+
+def _json_in(column: str) -> str:
+    """Build a fixed-text IN predicate bound to one JSON array parameter.
+
+    The SQL is the same however many values are passed, so every list size
+    reuses one cached prepared statement.
+
+    Args:
+        column: Hardcoded, table-qualified column name.
+
+    Returns:
+        Predicate matching rows whose column is in the bound array.
+    """
+    # Column names are hardcoded constants, safe for f-string
+    return f"{column} IN (SELECT value FROM json_each(?))"  # noqa: S608
 
 
 def _build_move_conditions(
@@ -834,19 +1033,16 @@ def _build_move_conditions(
 ) -> None:
     """Append move-level WHERE clauses for name, type, category, stats, and flags."""
     if filters.move_names:
-        placeholders = ", ".join(["?" for _ in filters.move_names])
-        conditions.append(f"m.name IN ({placeholders})")
-        params.extend(filters.move_names)
+        conditions.append(_json_in("m.name"))
+        params.append(json.dumps(filters.move_names))
 
     if filters.move_types:
-        placeholders = ", ".join(["?" for _ in filters.move_types])
-        conditions.append(f"m.type IN ({placeholders})")
-        params.extend(filters.move_types)
+        conditions.append(_json_in("m.type"))
+        params.append(json.dumps(filters.move_types))
 
     if filters.categories:
-        placeholders = ", ".join(["?" for _ in filters.categories])
-        conditions.append(f"m.category IN ({placeholders})")
-        params.extend(filters.categories)
+        conditions.append(_json_in("m.category"))
+        params.append(json.dumps(filters.categories))
 
     # Column names are hardcoded constants, safe for f-string
     for col, min_val, max_val in [
@@ -883,9 +1079,8 @@ def _build_pokemon_conditions(
 ) -> None:
     """Append Pokemon, learn-method, and stat WHERE clauses."""
     if filters.learn_methods:
-        placeholders = ", ".join(["?" for _ in filters.learn_methods])
-        conditions.append(f"pm.learn_method IN ({placeholders})")
-        params.extend(filters.learn_methods)
+        conditions.append(_json_in("pm.learn_method"))
+        params.append(json.dumps(filters.learn_methods))
 
     if filters.max_learn_level is not None:
         conditions.append("(pm.learn_method != 'level' OR pm.level <= ?)")
@@ -919,17 +1114,16 @@ def _build_progress_conditions(
     if filters.available_pokemon is not None:
         if not filters.available_pokemon:
             return False
-        placeholders = ", ".join(["?" for _ in filters.available_pokemon])
-        conditions.append(f"p.name IN ({placeholders})")
-        params.extend(sorted(filters.available_pokemon))
+        # json_each membership is order-independent, so the set is encoded unsorted
+        conditions.append(_json_in("p.name"))
+        params.append(json.dumps(list(filters.available_pokemon)))
 
     if filters.available_tm_keys is not None:
         if not filters.available_tm_keys:
             conditions.append("pm.learn_method != 'tm'")
         else:
-            placeholders = ", ".join(["?" for _ in filters.available_tm_keys])
-            conditions.append(f"(pm.learn_method != 'tm' OR pm.move_key IN ({placeholders}))")
-            params.extend(sorted(filters.available_tm_keys))
+            conditions.append(f"(pm.learn_method != 'tm' OR {_json_in('pm.move_key')})")
+            params.append(json.dumps(list(filters.available_tm_keys)))
 
     return True
 
@@ -952,7 +1146,7 @@ _MOVE_SEARCH_BASE_QUERY = """
 """
 
 
-@st.cache_data
+@st.cache_data(max_entries=_SEARCH_CACHE_ENTRIES, show_spinner=False)
 def search_moves_advanced(
     filters: "MoveSearchFilters",
     db_path: Path | None = None,
@@ -969,8 +1163,6 @@ def search_moves_advanced(
     Returns:
         List of dicts with Pokemon, move, and learn-method details per row.
     """
-    conn = _get_conn(db_path)
-
     conditions: list[str] = []
     params: list[Any] = []
 
@@ -984,10 +1176,8 @@ def search_moves_advanced(
         query += " WHERE " + " AND ".join(conditions)
     query += " ORDER BY p.bst DESC, p.name ASC, m.power DESC"
 
-    cursor = conn.execute(query, params)
-    results = fetchall_to_dicts(cursor)
-
-    for row in results:
-        row["is_stab"] = bool(row["is_stab"])
-
-    return results
+    with _get_conn(db_path) as conn:
+        cursor = conn.execute(query, params)
+        column_names = [desc[0] for desc in cursor.description]
+        # SQLite has no boolean type, so coerce is_stab (the last column) while building each row
+        return [dict(zip(column_names, row, strict=True), is_stab=row[-1] == 1) for row in cursor]
@@ -1,13 +1,22 @@
 # ABOUTME: TM availability filtering based on game progression.
 # ABOUTME: Determines which TM moves are accessible given current locations and HMs.
 
+import json
 from pathlib import Path
 
 import streamlit as st
 
-from unbounddb.app.db import fetchall_to_dicts
 from unbounddb.app.location_filters import LocationFilterConfig
-from unbounddb.app.queries import _get_conn
+from unbounddb.app.queries import _get_conn, _table_names
+
+# TMs that pass the post-game and location checks. Bind :post_game and
+# :accessible (a JSON array of location names, or NULL for no restriction).
+_TM_CANDIDATES_QUERY = """
+    SELECT move_key, required_hms
+    FROM tm_locations
+    WHERE (:post_game OR COALESCE(is_post_game, 0) = 0)
+      AND (:accessible IS NULL OR location IN (SELECT value FROM json_each(:accessible)))
+"""
 
 
 @st.cache_data
@@ -34,42 +43,28 @@ def get_available_tm_move_keys(
     if filter_config is None:
         return None
 
-    conn = _get_conn(db_path)
-
-    # Check if tm_locations table exists
-    tables = conn.execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall()
-    table_names = {row[0] for row in tables}
-    if "tm_locations" not in table_names:
+    # Check if tm_locations table exists (table names are cached per process)
+    if "tm_locations" not in _table_names(db_path):
         return None
 
-    query = "SELECT move_key, location, required_hms, is_post_game FROM tm_locations"
-    cursor = conn.execute(query)
-    rows = fetchall_to_dicts(cursor)
-
-    if not rows:
-        return frozenset()
+    # Post-game and location checks run in SQL; only the HM subset check needs Python
+    params = {
+        "post_game": filter_config.post_game,
+        "accessible": json.dumps(filter_config.accessible_locations) if filter_config.accessible_locations else None,
+    }
+    with _get_conn(db_path) as conn:
+        cursor = conn.execute(_TM_CANDIDATES_QUERY, params)
+        rows = cursor.fetchall()
 
-    accessible = set(filter_config.accessible_locations) if filter_config.accessible_locations else set()
     available_hms = filter_config.available_hms
 
     available_keys: set[str] = set()
 
-    for row in rows:
-        # Check post-game restriction
-        if row["is_post_game"] and not filter_config.post_game:
+    for move_key, required_hms_str in rows:
+        # Check HM requirements, stopping at the first missing HM
+        if required_hms_str and not all(hm.strip() in available_hms for hm in required_hms_str.split(",")):
             continue
 
-        # Check location accessibility
-        if accessible and row["location"] not in accessible:
-            continue
-
-        # Check HM requirements
-        required_hms_str: str = row["required_hms"]
-        if required_hms_str:
-            required = {hm.strip() for hm in required_hms_str.split(",")}
-            if not required.issubset(available_hms):
-                continue
-
-        available_keys.add(row["move_key"])
+        available_keys.add(move_key)
 
     return frozenset(available_keys)
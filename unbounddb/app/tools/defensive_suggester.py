@@ -1,22 +1,39 @@
 # ABOUTME: Defensive type suggester tool for analyzing trainer matchups.
 # ABOUTME: Suggests optimal defensive type combinations against trainer teams.
 
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
 import streamlit as st
 
-from unbounddb.app.db import fetchall_to_dicts
+from unbounddb.app.db import fetchall_column, fetchall_to_dicts
 from unbounddb.app.queries import _get_conn
 from unbounddb.utils.type_chart import (
+    EFFECTIVENESS_TABLE,
+    NO_TYPE_INDEX,
+    TYPE_INDEX,
+    TYPES,
     generate_all_type_combinations,
-    get_effectiveness,
     score_defensive_typing,
+    type_index,
+)
+
+# The 171 defensive typings never change, so build them once
+_ALL_COMBOS = tuple(generate_all_type_combinations())
+
+# For each defensive (type1, type2) position, the attacking type indexes that hit it for more than 1x
+_SUPER_EFFECTIVE_ATTACKERS = tuple(
+    tuple(
+        frozenset(atk for atk, atk_row in enumerate(EFFECTIVENESS_TABLE) if atk_row[def_index1][def_index2] > 1.0)
+        for def_index2 in range(NO_TYPE_INDEX + 1)
+    )
+    for def_index1 in range(len(TYPES))
 )
 
 
 def _count_neutralized_pokemon(
-    pokemon_by_slot: dict[int, list[str]],
+    move_type_indexes: Iterable[tuple[int, ...]],
     def_type1: str,
     def_type2: str | None,
 ) -> int:
@@ -25,52 +42,37 @@ def _count_neutralized_pokemon(
     A Pokemon is neutralized if none of their moves are super-effective.
 
     Args:
-        pokemon_by_slot: Dict mapping slot numbers to lists of move types.
+        move_type_indexes: Per Pokemon, the TYPE_INDEX positions of its move types.
         def_type1: Defensive type 1.
         def_type2: Defensive type 2 (or None for monotype).
 
     Returns:
         Number of Pokemon that are neutralized.
     """
-    neutralized_count = 0
-    for their_move_types in pokemon_by_slot.values():
-        is_neutralized = all(
-            get_effectiveness(move_type, def_type1, def_type2) <= 1.0 for move_type in their_move_types
-        )
-        if is_neutralized:
-            neutralized_count += 1
-    return neutralized_count
+    super_effective = _SUPER_EFFECTIVE_ATTACKERS[TYPE_INDEX[def_type1]][type_index(def_type2)]
+    return sum(1 for their_move_types in move_type_indexes if super_effective.isdisjoint(their_move_types))
 
 
-def _build_pokemon_move_types(pokemon_moves_df: list[dict[str, Any]]) -> dict[int, list[str]]:
+def _build_pokemon_move_types(pokemon_moves_df: list[dict[str, Any]]) -> dict[int, tuple[int, ...]]:
     """Build a mapping of Pokemon slots to their offensive move types.
 
     Args:
-        pokemon_moves_df: List of dicts with pokemon moves data.
+        pokemon_moves_df: List of dicts with offensive pokemon moves data.
 
     Returns:
-        Dict mapping slot numbers to lists of unique move types.
+        Dict mapping slot numbers to the sorted, unique TYPE_INDEX positions of their move types.
     """
-    pokemon_by_slot: dict[int, list[str]] = {}
+    pokemon_by_slot: dict[int, set[int]] = {}
     for row in pokemon_moves_df:
-        slot = row["slot"]
-        move_type = row["move_type"]
-        category = row["move_category"]
-
-        # Only count offensive moves (Physical/Special)
-        if category != "Status" and move_type:
-            if slot not in pokemon_by_slot:
-                pokemon_by_slot[slot] = []
-            if move_type not in pokemon_by_slot[slot]:
-                pokemon_by_slot[slot].append(move_type)
-    return pokemon_by_slot
+        pokemon_by_slot.setdefault(row["slot"], set()).add(TYPE_INDEX[row["move_type"]])
+    return {slot: tuple(sorted(move_types)) for slot, move_types in pokemon_by_slot.items()}
 
 
 def _score_type_combination(
     def_type1: str,
     def_type2: str | None,
     move_types: list[str],
-    pokemon_by_slot: dict[int, list[str]],
+    move_type_indexes: Iterable[tuple[int, ...]],
 ) -> dict[str, Any]:
     """Score a single defensive type combination.
 
@@ -78,13 +80,13 @@ def _score_type_combination(
         def_type1: Defensive type 1.
         def_type2: Defensive type 2 (or None for monotype).
         move_types: List of attacking move types.
-        pokemon_by_slot: Dict mapping slot numbers to move types.
+        move_type_indexes: Per Pokemon, the TYPE_INDEX positions of its move types.
 
     Returns:
         Dict with scoring data for this type combination.
     """
     scoring = score_defensive_typing(def_type1, def_type2, move_types)
-    neutralized_count = _count_neutralized_pokemon(pokemon_by_slot, def_type1, def_type2)
+    neutralized_count = _count_neutralized_pokemon(move_type_indexes, def_type1, def_type2)
 
     score = (
         scoring["immunity_count"] * 3
@@ -122,58 +124,65 @@ def get_battle_move_types(battle_id: int, db_path: Path | None = None) -> list[s
     Returns:
         List of unique move types (title case, e.g., "Fire", "Water").
     """
-    conn = _get_conn(db_path)
-
-    query = """
-        SELECT DISTINCT m.type AS move_type
-        FROM battle_pokemon tp
-        JOIN battle_pokemon_moves tpm ON tp.id = tpm.battle_pokemon_id
-        JOIN moves m ON tpm.move_key = m.move_key
-        WHERE tp.battle_id = ?
-          AND m.category != 'Status'
-          AND m.type IS NOT NULL
-        ORDER BY m.type
-    """
-
-    result = conn.execute(query, [battle_id]).fetchall()
+    with _get_conn(db_path) as conn:
+        query = """
+            SELECT DISTINCT m.type AS move_type
+            FROM battle_pokemon tp
+            JOIN battle_pokemon_moves tpm ON tp.id = tpm.battle_pokemon_id
+            JOIN moves m ON tpm.move_key = m.move_key
+            WHERE tp.battle_id = ?
+              AND m.category != 'Status'
+              AND m.type IS NOT NULL
+            ORDER BY m.type
+        """
+
+        cursor = conn.execute(query, [battle_id])
+        result = fetchall_column(cursor)
 
-    return [row[0] for row in result]
+    return result
 
 
 @st.cache_data
-def get_battle_pokemon_with_moves(battle_id: int, db_path: Path | None = None) -> list[dict[str, Any]]:
+def get_battle_pokemon_with_moves(
+    battle_id: int, db_path: Path | None = None, include_status: bool = False
+) -> list[dict[str, Any]]:
     """Get battle's Pokemon with their moves and types.
 
     Args:
         battle_id: ID of the battle to analyze.
         db_path: Optional path to database.
+        include_status: Whether to include Status moves and moves without a type.
+            By default only offensive (Physical/Special) moves are returned.
 
     Returns:
         List of dicts with keys:
         - pokemon_key, slot, type1, type2, move_key, move_name, move_type, move_category
     """
-    conn = _get_conn(db_path)
-
-    query = """
-        SELECT
-            tp.pokemon_key,
-            tp.slot,
-            p.type1 AS pokemon_type1,
-            p.type2 AS pokemon_type2,
-            tpm.move_key,
-            m.name AS move_name,
-            m.type AS move_type,
-            m.category AS move_category
-        FROM battle_pokemon tp
-        JOIN pokemon p ON tp.pokemon_key = p.pokemon_key
-        JOIN battle_pokemon_moves tpm ON tp.id = tpm.battle_pokemon_id
-        JOIN moves m ON tpm.move_key = m.move_key
-        WHERE tp.battle_id = ?
-        ORDER BY tp.slot, tpm.slot
-    """
-
-    cursor = conn.execute(query, [battle_id])
-    result = fetchall_to_dicts(cursor)
+    offensive_filter = "" if include_status else "AND m.category != 'Status' AND m.type <> ''"
+
+    with _get_conn(db_path) as conn:
+        # The filter is one of two hardcoded strings, safe for f-string
+        query = f"""
+            SELECT
+                tp.pokemon_key,
+                tp.slot,
+                p.type1 AS pokemon_type1,
+                p.type2 AS pokemon_type2,
+                tpm.move_key,
+                m.name AS move_name,
+                m.type AS move_type,
+                m.category AS move_category
+            FROM battle_pokemon tp
+            JOIN pokemon p ON tp.pokemon_key = p.pokemon_key
+            JOIN battle_pokemon_moves tpm ON tp.id = tpm.battle_pokemon_id
+            JOIN moves m ON tpm.move_key = m.move_key
+            WHERE tp.battle_id = ?
+              {offensive_filter}
+            ORDER BY tp.slot, tpm.slot
+        """  # noqa: S608
+
+        cursor = conn.execute(query, [battle_id])
+        result = fetchall_to_dicts(cursor)
 
     return result
 
@@ -204,13 +213,27 @@ def analyze_battle_defense(battle_id: int, db_path: Path | None = None) -> list[
 
     # Get Pokemon with their moves for neutralization calculation
     pokemon_moves_df = get_battle_pokemon_with_moves(battle_id, db_path)
-    pokemon_by_slot = _build_pokemon_move_types(pokemon_moves_df)
+    move_type_indexes = list(_build_pokemon_move_types(pokemon_moves_df).values())
+
+    return _score_all_type_combinations(move_types, move_type_indexes)
+
+
+def _score_all_type_combinations(
+    move_types: list[str],
+    move_type_indexes: list[tuple[int, ...]],
+) -> list[dict[str, Any]]:
+    """Score and rank all 171 type combinations against one team's moves.
 
-    # Analyze all 171 type combinations
-    all_combos = generate_all_type_combinations()
+    Args:
+        move_types: Unique attacking move types of the team.
+        move_type_indexes: Per Pokemon, the sorted TYPE_INDEX positions of its move types.
+
+    Returns:
+        List of scoring dicts, sorted by score DESC.
+    """
     results = [
-        _score_type_combination(def_type1, def_type2, move_types, pokemon_by_slot)
-        for def_type1, def_type2 in all_combos
+        _score_type_combination(def_type1, def_type2, move_types, move_type_indexes)
+        for def_type1, def_type2 in _ALL_COMBOS
     ]
 
     return sorted(results, key=lambda r: r["score"], reverse=True)
@@ -242,49 +265,35 @@ def get_neutralized_pokemon_detail(
     if not pokemon_moves_df:
         return []
 
-    # Group by Pokemon and find their best move
-    results: list[dict[str, Any]] = []
-    seen_slots: set[int] = set()
+    def_index1 = TYPE_INDEX[def_type1]
+    def_index2 = type_index(def_type2)
+
+    # Group by Pokemon and keep their best move; ties keep the earlier move
+    best_by_slot: dict[int, dict[str, Any]] = {}
 
     for row in pokemon_moves_df:
         slot = row["slot"]
-        pokemon_key = row["pokemon_key"]
-        pokemon_type1 = row["pokemon_type1"]
-        pokemon_type2 = row["pokemon_type2"]
-        move_name = row["move_name"]
         move_type = row["move_type"]
-        category = row["move_category"]
-
-        # Skip Status moves
-        if category == "Status" or not move_type:
-            continue
-
-        effectiveness = get_effectiveness(move_type, def_type1, def_type2)
-
-        # Check if this Pokemon slot already exists
-        if slot not in seen_slots:
-            seen_slots.add(slot)
-            results.append(
-                {
-                    "pokemon_key": pokemon_key,
-                    "slot": slot,
-                    "pokemon_type1": pokemon_type1,
-                    "pokemon_type2": pokemon_type2,
-                    "best_move": move_name,
-                    "best_move_type": move_type,
-                    "best_effectiveness": effectiveness,
-                }
-            )
-        else:
-            # Update if this move is better
-            for r in results:
-                if r["slot"] == slot and effectiveness > r["best_effectiveness"]:
-                    r["best_move"] = move_name
-                    r["best_move_type"] = move_type
-                    r["best_effectiveness"] = effectiveness
-                    break
+        effectiveness = EFFECTIVENESS_TABLE[TYPE_INDEX[move_type]][def_index1][def_index2]
+
+        best = best_by_slot.get(slot)
+        if best is None:
+            best_by_slot[slot] = {
+                "pokemon_key": row["pokemon_key"],
+                "slot": slot,
+                "pokemon_type1": row["pokemon_type1"],
+                "pokemon_type2": row["pokemon_type2"],
+                "best_move": row["move_name"],
+                "best_move_type": move_type,
+                "best_effectiveness": effectiveness,
+            }
+        elif effectiveness > best["best_effectiveness"]:
+            best["best_move"] = row["move_name"]
+            best["best_move_type"] = move_type
+            best["best_effectiveness"] = effectiveness
 
     # Add is_neutralized flag
+    results = list(best_by_slot.values())
     for r in results:
         r["is_neutralized"] = r["best_effectiveness"] <= 1.0
 
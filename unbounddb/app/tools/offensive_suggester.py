@@ -1,19 +1,26 @@
 # ABOUTME: Offensive type suggester tool for analyzing trainer matchups.
 # ABOUTME: Suggests optimal attacking types and 4-type coverage against trainer teams.
 
+import heapq
+from collections import Counter
 from itertools import combinations
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, TypedDict
 
 import streamlit as st
 
+from unbounddb.app.db import fetchall_to_dicts
 from unbounddb.app.queries import _get_conn
 from unbounddb.utils.type_chart import (
+    EFFECTIVENESS_TABLE,
     IMMUNITY_VALUE,
     NEUTRAL_VALUE,
     SUPER_EFFECTIVE_THRESHOLD,
+    TYPE_INDEX,
     TYPES,
     get_effectiveness,
+    type_index,
 )
 
 # Threshold for 4x effectiveness (2x * 2x)
@@ -38,37 +45,70 @@ def get_battle_pokemon_types(battle_id: int, db_path: Path | None = None) -> lis
     Returns:
         List of dicts with keys: slot, pokemon_key, type1, type2
     """
-    conn = _get_conn(db_path)
-
-    query = """
-        SELECT
-            tp.slot,
-            tp.pokemon_key,
-            p.type1,
-            p.type2
-        FROM battle_pokemon tp
-        JOIN pokemon p ON tp.pokemon_key = p.pokemon_key
-        WHERE tp.battle_id = ?
-        ORDER BY tp.slot
-    """
+    with _get_conn(db_path) as conn:
+        query = """
+            SELECT
+                tp.slot,
+                tp.pokemon_key,
+                p.type1,
+                p.type2
+            FROM battle_pokemon tp
+            JOIN pokemon p ON tp.pokemon_key = p.pokemon_key
+            WHERE tp.battle_id = ?
+            ORDER BY tp.slot
+        """
 
-    result = conn.execute(query, [battle_id]).fetchall()
+        cursor = conn.execute(query, [battle_id])
+        result = fetchall_to_dicts(cursor)
 
-    return [
-        {
-            "slot": row[0],
-            "pokemon_key": row[1],
-            "type1": row[2],
-            "type2": row[3],
-        }
-        for row in result
-    ]
+    return result
 
 
 # Alias for internal use
 _build_battle_pokemon_types = get_battle_pokemon_types
 
 
+def _defender_indexes(pokemon_list: list[dict[str, Any]]) -> list[tuple[int, int]]:
+    """Resolve each trainer Pokemon's typing to EFFECTIVENESS_TABLE positions.
+
+    Args:
+        pokemon_list: List of trainer Pokemon with type info.
+
+    Returns:
+        List of (type1, type2) index pairs in pokemon_list order.
+    """
+    return [(TYPE_INDEX[pkmn["type1"]], type_index(pkmn["type2"])) for pkmn in pokemon_list]
+
+
+def _effectiveness_category(effectiveness: float) -> str:
+    """Label an effectiveness multiplier.
+
+    Args:
+        effectiveness: Multiplier from the type chart.
+
+    Returns:
+        One of "immune", "4x", "2x", "neutral", "resisted".
+    """
+    if effectiveness == IMMUNITY_VALUE:
+        return "immune"
+    if effectiveness >= SUPER_EFFECTIVE_4X_THRESHOLD:
+        return "4x"
+    if effectiveness >= SUPER_EFFECTIVE_THRESHOLD:
+        return "2x"
+    if effectiveness == NEUTRAL_VALUE:
+        return "neutral"
+    return "resisted"
+
+
+# The chart only produces a handful of distinct multipliers, so label each once
+_CATEGORY_BY_EFFECTIVENESS: dict[float, str] = {
+    effectiveness: _effectiveness_category(effectiveness)
+    for atk_row in EFFECTIVENESS_TABLE
+    for def_row in atk_row
+    for effectiveness in def_row
+}
+
+
 def _calculate_attack_effectiveness(atk_type: str, def_type1: str, def_type2: str | None) -> EffectivenessResult:
     """Calculate offensive effectiveness with category label.
 
@@ -82,21 +122,10 @@ def _calculate_attack_effectiveness(atk_type: str, def_type1: str, def_type2: st
     """
     effectiveness = get_effectiveness(atk_type, def_type1, def_type2)
 
-    if effectiveness == IMMUNITY_VALUE:
-        category = "immune"
-    elif effectiveness >= SUPER_EFFECTIVE_4X_THRESHOLD:
-        category = "4x"
-    elif effectiveness >= SUPER_EFFECTIVE_THRESHOLD:
-        category = "2x"
-    elif effectiveness == NEUTRAL_VALUE:
-        category = "neutral"
-    else:
-        category = "resisted"
+    return {"effectiveness": effectiveness, "category": _CATEGORY_BY_EFFECTIVENESS[effectiveness]}
 
-    return {"effectiveness": effectiveness, "category": category}
 
-
-def _score_single_type(atk_type: str, pokemon_list: list[dict[str, Any]]) -> dict[str, Any]:
+def _score_single_type(atk_type: str, defender_indexes: list[tuple[int, int]]) -> dict[str, Any]:
     """Score a single attacking type against a Pokemon list.
 
     Scoring formula:
@@ -104,26 +133,30 @@ def _score_single_type(atk_type: str, pokemon_list: list[dict[str, Any]]) -> dic
 
     Args:
         atk_type: The attacking type to score.
-        pokemon_list: List of trainer Pokemon with type info.
+        defender_indexes: EFFECTIVENESS_TABLE (type1, type2) positions of each trainer Pokemon.
 
     Returns:
         Dict with type, 4x/2x/neutral/resisted/immune counts, score
     """
-    counts = {"4x": 0, "2x": 0, "neutral": 0, "resisted": 0, "immune": 0}
-
-    for pkmn in pokemon_list:
-        result = _calculate_attack_effectiveness(atk_type, pkmn["type1"], pkmn["type2"])
-        counts[result["category"]] += 1
-
-    score = counts["4x"] * 8 + counts["2x"] * 4 - counts["resisted"] * 2 - counts["immune"] * 6
+    atk_row = EFFECTIVENESS_TABLE[TYPE_INDEX[atk_type]]
+    counts = Counter(
+        _CATEGORY_BY_EFFECTIVENESS[atk_row[def_index1][def_index2]] for def_index1, def_index2 in defender_indexes
+    )
+    count_4x = counts["4x"]
+    count_2x = counts["2x"]
+    neutral_count = counts["neutral"]
+    resisted_count = counts["resisted"]
+    immune_count = counts["immune"]
+
+    score = count_4x * 8 + count_2x * 4 - resisted_count * 2 - immune_count * 6
 
     return {
         "type": atk_type,
-        "4x_count": counts["4x"],
-        "2x_count": counts["2x"],
-        "neutral_count": counts["neutral"],
-        "resisted_count": counts["resisted"],
-        "immune_count": counts["immune"],
+        "4x_count": count_4x,
+        "2x_count": count_2x,
+        "neutral_count": neutral_count,
+        "resisted_count": resisted_count,
+        "immune_count": immune_count,
         "score": score,
     }
 
@@ -146,17 +179,14 @@ def analyze_single_type_offense(battle_id: int, db_path: Path | None = None) ->
     if not pokemon_list:
         return []
 
-    results = [_score_single_type(atk_type, pokemon_list) for atk_type in TYPES]
+    defender_indexes = _defender_indexes(pokemon_list)
+    results = [_score_single_type(atk_type, defender_indexes) for atk_type in TYPES]
 
     return sorted(results, key=lambda r: r["score"], reverse=True)
 
 
-def _score_type_combo(
-    types: tuple[str, ...],
-    pokemon_list: list[dict[str, Any]],
-    effectiveness_cache: dict[tuple[str, str], float],
-) -> dict[str, Any]:
-    """Score a 4-type combination for coverage.
+def _combo_coverage(effectiveness_rows: tuple[tuple[float, ...], ...]) -> tuple[int, int]:
+    """Count covered Pokemon and score a combination of attacking types.
 
     A Pokemon is 'covered' if at least one type hits it >= 2x.
 
@@ -164,38 +194,41 @@ def _score_type_combo(
         score = pokemon_covered * 10 + sum_of_best_effectiveness * 2 - uncovered_count * 15
 
     Args:
-        types: Tuple of 4 attacking types.
-        pokemon_list: List of trainer Pokemon with type info.
-        effectiveness_cache: Pre-computed effectiveness values.
+        effectiveness_rows: For each attacking type, its effectiveness against every trainer Pokemon.
 
     Returns:
-        Dict with types, covered_count, total_pokemon, coverage_pct, score
+        Tuple of (covered_count, score).
     """
-    covered_count = 0
-    sum_best_effectiveness = 0.0
+    best_effectiveness = list(map(max, *effectiveness_rows))
+    covered_count = sum(1 for best in best_effectiveness if best >= SUPER_EFFECTIVE_THRESHOLD)
+    uncovered_count = len(best_effectiveness) - covered_count
 
-    for pkmn in pokemon_list:
-        pokemon_key = pkmn["pokemon_key"]
-        best_eff = 0.0
+    score = int(covered_count * 10 + sum(best_effectiveness) * 2 - uncovered_count * 15)
 
-        for atk_type in types:
-            eff = effectiveness_cache[(atk_type, pokemon_key)]
-            best_eff = max(best_eff, eff)
+    return covered_count, score
 
-        if best_eff >= SUPER_EFFECTIVE_THRESHOLD:
-            covered_count += 1
-        sum_best_effectiveness += best_eff
 
-    total_pokemon = len(pokemon_list)
-    uncovered_count = total_pokemon - covered_count
+def _score_type_combo(
+    types: tuple[str, ...],
+    covered_count: int,
+    total_pokemon: int,
+    score: int,
+) -> dict[str, Any]:
+    """Build the result for a 4-type combination from its computed coverage.
 
-    score = int(covered_count * 10 + sum_best_effectiveness * 2 - uncovered_count * 15)
+    Args:
+        types: Tuple of 4 attacking types.
+        covered_count: Trainer Pokemon hit super-effectively, from _combo_coverage.
+        total_pokemon: Number of trainer Pokemon.
+        score: Combination score, from _combo_coverage.
 
+    Returns:
+        Dict with types, covered_count, total_pokemon, coverage_pct, score
+    """
     coverage_pct = (covered_count / total_pokemon * 100) if total_pokemon > 0 else 0
 
     return {
         "types": ", ".join(types),
-        "types_tuple": types,
         "covered_count": covered_count,
         "total_pokemon": total_pokemon,
         "coverage_pct": round(coverage_pct, 1),
@@ -221,25 +254,24 @@ def analyze_four_type_coverage(battle_id: int, db_path: Path | None = None, top_
     if not pokemon_list:
         return []
 
-    # Pre-compute effectiveness for all (type, pokemon) pairs
-    effectiveness_cache: dict[tuple[str, str], float] = {}
-    for atk_type in TYPES:
-        for pkmn in pokemon_list:
-            effectiveness_cache[(atk_type, pkmn["pokemon_key"])] = get_effectiveness(
-                atk_type, pkmn["type1"], pkmn["type2"]
-            )
-
-    # Evaluate all C(18, 4) = 3060 combinations
-    results = [_score_type_combo(combo, pokemon_list, effectiveness_cache) for combo in combinations(TYPES, 4)]
+    # One row per attacking type (in TYPES order) of its effectiveness against each Pokemon
+    defender_indexes = _defender_indexes(pokemon_list)
+    effectiveness_rows = [
+        tuple(atk_row[def_index1][def_index2] for def_index1, def_index2 in defender_indexes)
+        for atk_row in EFFECTIVENESS_TABLE
+    ]
 
-    # Sort and return top N
-    results.sort(key=lambda x: x["score"], reverse=True)
+    # Evaluate all C(18, 4) = 3060 combinations; both iterators yield combos in the same order
+    scored = (
+        (*_combo_coverage(rows), types)
+        for types, rows in zip(combinations(TYPES, 4), combinations(effectiveness_rows, 4), strict=True)
+    )
 
-    # Remove internal tuple before returning
-    for r in results:
-        del r["types_tuple"]
+    # nlargest matches a stable descending sort truncated to top_n, so only the winners become dicts
+    top = heapq.nlargest(top_n, scored, key=itemgetter(1))
 
-    return results[:top_n]
+    total_pokemon = len(pokemon_list)
+    return [_score_type_combo(types, covered_count, total_pokemon, score) for covered_count, score, types in top]
 
 
 @st.cache_data
@@ -1,6 +1,7 @@
 # ABOUTME: Physical/Special analyzer tool for analyzing trainer matchups.
 # ABOUTME: Analyzes whether to prioritize Physical or Special attack/defense.
 
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
@@ -10,6 +11,51 @@ from unbounddb.app.db import fetchall_to_dicts
 from unbounddb.app.queries import _get_conn
 
 
+@dataclass(frozen=True, slots=True)
+class OffensiveDetail:
+    """Per-Pokemon breakdown in analyze_battle_offensive_profile.
+
+    Slotted so the cached analysis holds six small objects per battle rather
+    than six dicts with their own key tables.
+
+    Attributes:
+        pokemon_key: Battle Pokemon's key.
+        slot: Team slot.
+        attack: Base Attack.
+        sp_attack: Base Sp.Attack.
+        profile: "Physical", "Special", or "Mixed".
+        physical_moves: Names of damaging Physical moves, in move slot order.
+        special_moves: Names of damaging Special moves, in move slot order.
+    """
+
+    pokemon_key: str
+    slot: int
+    attack: int
+    sp_attack: int
+    profile: str
+    physical_moves: tuple[str, ...]
+    special_moves: tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class DefensiveDetail:
+    """Per-Pokemon breakdown in analyze_battle_defensive_profile.
+
+    Attributes:
+        pokemon_key: Battle Pokemon's key.
+        slot: Team slot.
+        defense: Base Defense.
+        sp_defense: Base Sp.Defense.
+        profile: "Physically Defensive", "Specially Defensive", or "Balanced".
+    """
+
+    pokemon_key: str
+    slot: int
+    defense: int
+    sp_defense: int
+    profile: str
+
+
 @st.cache_data
 def get_battle_pokemon_with_stats(battle_id: int, db_path: Path | None = None) -> list[dict[str, Any]]:
     """Get battle's Pokemon with base stats.
@@ -22,31 +68,15 @@ def get_battle_pokemon_with_stats(battle_id: int, db_path: Path | None = None) -
         List of dicts with keys:
         - pokemon_key, slot, attack, defense, sp_attack, sp_defense
     """
-    conn = _get_conn(db_path)
-
-    query = """
-        SELECT
-            tp.pokemon_key,
-            tp.slot,
-            p.attack,
-            p.defense,
-            p.sp_attack,
-            p.sp_defense
-        FROM battle_pokemon tp
-        JOIN pokemon p ON tp.pokemon_key = p.pokemon_key
-        WHERE tp.battle_id = ?
-        ORDER BY tp.slot
-    """
+    return _fetch_battle_stats(battle_id, db_path)
 
-    cursor = conn.execute(query, [battle_id])
-    result = fetchall_to_dicts(cursor)
-
-    return result
 
+def _fetch_battle_stats(battle_id: int, db_path: Path | None = None) -> list[dict[str, Any]]:
+    """Fetch battle's Pokemon with base stats, uncached.
 
-@st.cache_data
-def get_battle_pokemon_move_categories(battle_id: int, db_path: Path | None = None) -> list[dict[str, Any]]:
-    """Get battle's Pokemon with their move categories.
+    Used by the cached analyses, which would otherwise store the same rows
+    twice. Filters on battle_id and orders by slot so the (battle_id, slot)
+    index answers both without a sort; keep that shape when editing the query.
 
     Args:
         battle_id: ID of the battle to analyze.
@@ -54,29 +84,131 @@ def get_battle_pokemon_move_categories(battle_id: int, db_path: Path | None = No
 
     Returns:
         List of dicts with keys:
-        - pokemon_key, slot, move_key, move_name, category, power
+        - pokemon_key, slot, attack, defense, sp_attack, sp_defense
     """
-    conn = _get_conn(db_path)
-
-    query = """
-        SELECT
-            tp.pokemon_key,
-            tp.slot,
-            tpm.move_key,
-            m.name AS move_name,
-            m.category,
-            m.power
-        FROM battle_pokemon tp
-        JOIN battle_pokemon_moves tpm ON tp.id = tpm.battle_pokemon_id
-        JOIN moves m ON tpm.move_key = m.move_key
-        WHERE tp.battle_id = ?
-        ORDER BY tp.slot, tpm.slot
+    with _get_conn(db_path) as conn:
+        query = """
+            SELECT
+                tp.pokemon_key,
+                tp.slot,
+                p.attack,
+                p.defense,
+                p.sp_attack,
+                p.sp_defense
+            FROM battle_pokemon tp
+            JOIN pokemon p ON tp.pokemon_key = p.pokemon_key
+            WHERE tp.battle_id = ?
+            ORDER BY tp.slot
+        """
+
+        cursor = conn.execute(query, [battle_id])
+        result = fetchall_to_dicts(cursor)
+
+    return result
+
+
+# Team stats with each Pokemon's moves in one pass. Moves are LEFT JOINed so a
+# Pokemon without known moves still yields its stats row; m.move_key is NULL for
+# those rows and for move keys missing from moves, which the caller skips.
+# Keep these as plain LEFT JOINs: a parenthesized (tpm JOIN m) is materialized
+# over every battle's moves on each call instead of using the per-id indexes.
+_BATTLE_STATS_AND_MOVES_QUERY = """
+    SELECT
+        tp.id,
+        tp.pokemon_key,
+        tp.slot,
+        p.attack,
+        p.defense,
+        p.sp_attack,
+        p.sp_defense,
+        m.move_key,
+        m.name AS move_name,
+        m.category,
+        m.power
+    FROM battle_pokemon tp
+    JOIN pokemon p ON tp.pokemon_key = p.pokemon_key
+    LEFT JOIN battle_pokemon_moves tpm ON tp.id = tpm.battle_pokemon_id
+    LEFT JOIN moves m ON tpm.move_key = m.move_key
+    WHERE tp.battle_id = ?
+    ORDER BY tp.slot, tpm.slot
+"""
+
+
+def _fetch_battle_stats_and_moves(
+    battle_id: int, db_path: Path | None = None
+) -> tuple[list[dict[str, Any]], dict[int, list[dict[str, Any]]]]:
+    """Fetch a battle's team stats and moves with a single query.
+
+    Args:
+        battle_id: ID of the battle to analyze.
+        db_path: Optional path to database.
+
+    Returns:
+        Tuple of (stats rows shaped like get_battle_pokemon_with_stats,
+        dict mapping slot numbers to lists of move dicts with keys
+        move_key, move_name, category, power).
     """
+    stats_rows: list[dict[str, Any]] = []
+    moves_by_slot: dict[int, list[dict[str, Any]]] = {}
+    seen_ids: set[int] = set()
+
+    with _get_conn(db_path) as conn:
+        cursor = conn.execute(_BATTLE_STATS_AND_MOVES_QUERY, [battle_id])
+        for row_id, pokemon_key, slot, attack, defense, sp_attack, sp_defense, *move in cursor:
+            if row_id not in seen_ids:
+                seen_ids.add(row_id)
+                stats_rows.append(
+                    {
+                        "pokemon_key": pokemon_key,
+                        "slot": slot,
+                        "attack": attack,
+                        "defense": defense,
+                        "sp_attack": sp_attack,
+                        "sp_defense": sp_defense,
+                    }
+                )
+
+            move_key, move_name, category, power = move
+            if move_key is not None:
+                moves_by_slot.setdefault(slot, []).append(
+                    {"move_key": move_key, "move_name": move_name, "category": category, "power": power}
+                )
+
+    return stats_rows, moves_by_slot
+
+
+def _classify_moves(
+    pokemon_moves: list[dict[str, Any]],
+) -> tuple[str, list[dict[str, Any]], list[dict[str, Any]]]:
+    """Split a Pokemon's damaging moves by category and classify its profile.
 
-    cursor = conn.execute(query, [battle_id])
-    result = fetchall_to_dicts(cursor)
+    Args:
+        pokemon_moves: List of move dicts with keys: category, power
 
-    return result
+    Returns:
+        Tuple of (profile, damaging Physical moves, damaging Special moves),
+        with moves kept in their original order. Profile rules are those of
+        classify_pokemon_offensive_profile.
+    """
+    physical_moves: list[dict[str, Any]] = []
+    special_moves: list[dict[str, Any]] = []
+    for move in pokemon_moves:
+        if (move.get("power") or 0) <= 0:
+            continue
+        category = move.get("category")
+        if category == "Physical":
+            physical_moves.append(move)
+        elif category == "Special":
+            special_moves.append(move)
+
+    if physical_moves and not special_moves:
+        profile = "Physical"
+    elif special_moves and not physical_moves:
+        profile = "Special"
+    else:
+        profile = "Mixed"
+
+    return profile, physical_moves, special_moves
 
 
 def classify_pokemon_offensive_profile(pokemon_moves: list[dict[str, Any]]) -> str:
@@ -92,18 +224,8 @@ def classify_pokemon_offensive_profile(pokemon_moves: list[dict[str, Any]]) -> s
         - Both → "Mixed"
         - Neither (status only) → "Mixed" (default)
     """
-    physical_moves = [m for m in pokemon_moves if m.get("category") == "Physical" and (m.get("power") or 0) > 0]
-    special_moves = [m for m in pokemon_moves if m.get("category") == "Special" and (m.get("power") or 0) > 0]
-
-    has_physical = len(physical_moves) > 0
-    has_special = len(special_moves) > 0
-
-    if has_physical and not has_special:
-        return "Physical"
-    elif has_special and not has_physical:
-        return "Special"
-    else:
-        return "Mixed"
+    profile, _, _ = _classify_moves(pokemon_moves)
+    return profile
 
 
 def classify_pokemon_defensive_profile(defense: int, sp_defense: int) -> str:
@@ -127,31 +249,6 @@ def classify_pokemon_defensive_profile(defense: int, sp_defense: int) -> str:
         return "Balanced"
 
 
-def _group_moves_by_slot(moves_df: list[dict[str, Any]]) -> dict[int, list[dict[str, Any]]]:
-    """Group moves list by Pokemon slot.
-
-    Args:
-        moves_df: List of move dicts.
-
-    Returns:
-        Dict mapping slot numbers to lists of move dicts.
-    """
-    pokemon_moves_by_slot: dict[int, list[dict[str, Any]]] = {}
-    for row in moves_df:
-        slot = row["slot"]
-        if slot not in pokemon_moves_by_slot:
-            pokemon_moves_by_slot[slot] = []
-        pokemon_moves_by_slot[slot].append(
-            {
-                "move_key": row["move_key"],
-                "move_name": row["move_name"],
-                "category": row["category"],
-                "power": row["power"],
-            }
-        )
-    return pokemon_moves_by_slot
-
-
 def _get_offensive_recommendation(
     physical_count: int,
     special_count: int,
@@ -183,7 +280,7 @@ def _get_offensive_recommendation(
 def _build_pokemon_offensive_detail(
     row: dict[str, Any],
     moves: list[dict[str, Any]],
-) -> tuple[dict[str, Any], int, int]:
+) -> tuple[OffensiveDetail, int, int]:
     """Build offensive detail for a single Pokemon.
 
     Args:
@@ -191,25 +288,21 @@ def _build_pokemon_offensive_detail(
         moves: List of Pokemon's moves.
 
     Returns:
-        Tuple of (detail dict, physical power sum, special power sum).
+        Tuple of (detail, physical power sum, special power sum).
     """
-    profile = classify_pokemon_offensive_profile(moves)
-
-    physical_moves = [m for m in moves if m.get("category") == "Physical" and (m.get("power") or 0) > 0]
-    special_moves = [m for m in moves if m.get("category") == "Special" and (m.get("power") or 0) > 0]
-
-    phys_power = sum(m.get("power") or 0 for m in physical_moves)
-    spec_power = sum(m.get("power") or 0 for m in special_moves)
-
-    detail = {
-        "pokemon_key": row["pokemon_key"],
-        "slot": row["slot"],
-        "attack": row["attack"],
-        "sp_attack": row["sp_attack"],
-        "profile": profile,
-        "physical_moves": [m["move_name"] for m in physical_moves],
-        "special_moves": [m["move_name"] for m in special_moves],
-    }
+    profile, physical_moves, special_moves = _classify_moves(moves)
+
+    detail = OffensiveDetail(
+        pokemon_key=row["pokemon_key"],
+        slot=row["slot"],
+        attack=row["attack"],
+        sp_attack=row["sp_attack"],
+        profile=profile,
+        physical_moves=tuple(move["move_name"] for move in physical_moves),
+        special_moves=tuple(move["move_name"] for move in special_moves),
+    )
+    phys_power = sum(move["power"] for move in physical_moves)
+    spec_power = sum(move["power"] for move in special_moves)
 
     return detail, phys_power, spec_power
 
@@ -249,32 +342,33 @@ def analyze_battle_offensive_profile(battle_id: int, db_path: Path | None = None
         - avg_team_attack: float
         - avg_team_sp_attack: float
         - recommendation: str ("Prioritize Defense" / "Prioritize Sp.Def" / "Balance both")
-        - pokemon_details: list[dict] (per-Pokemon breakdown)
+        - pokemon_details: list[OffensiveDetail] (per-Pokemon breakdown)
     """
-    moves_df = get_battle_pokemon_move_categories(battle_id, db_path)
-    stats_df = get_battle_pokemon_with_stats(battle_id, db_path)
+    stats_df, pokemon_moves_by_slot = _fetch_battle_stats_and_moves(battle_id, db_path)
 
-    if not moves_df or not stats_df:
+    if not pokemon_moves_by_slot or not stats_df:
         return _empty_offensive_profile()
 
-    pokemon_moves_by_slot = _group_moves_by_slot(moves_df)
-
-    pokemon_details: list[dict[str, Any]] = []
+    pokemon_details: list[OffensiveDetail] = []
     profile_counts = {"Physical": 0, "Special": 0, "Mixed": 0}
     total_physical_power = 0
     total_special_power = 0
+    total_attack = 0
+    total_sp_attack = 0
 
     for row in stats_df:
         moves = pokemon_moves_by_slot.get(row["slot"], [])
         detail, phys_power, spec_power = _build_pokemon_offensive_detail(row, moves)
 
-        profile_counts[detail["profile"]] += 1
+        profile_counts[detail.profile] += 1
         total_physical_power += phys_power
         total_special_power += spec_power
+        total_attack += row["attack"]
+        total_sp_attack += row["sp_attack"]
         pokemon_details.append(detail)
 
-    avg_team_attack = sum(r["attack"] for r in stats_df) / len(stats_df)
-    avg_team_sp_attack = sum(r["sp_attack"] for r in stats_df) / len(stats_df)
+    avg_team_attack = total_attack / len(stats_df)
+    avg_team_sp_attack = total_sp_attack / len(stats_df)
 
     recommendation = _get_offensive_recommendation(
         profile_counts["Physical"],
@@ -314,9 +408,9 @@ def analyze_battle_defensive_profile(battle_id: int, db_path: Path | None = None
         - avg_team_defense: float
         - avg_team_sp_defense: float
         - recommendation: str ("Use Physical moves" / "Use Special moves" / "Either works")
-        - pokemon_details: list[dict] (per-Pokemon breakdown)
+        - pokemon_details: list[DefensiveDetail] (per-Pokemon breakdown)
     """
-    stats_df = get_battle_pokemon_with_stats(battle_id, db_path)
+    stats_df = _fetch_battle_stats(battle_id, db_path)
 
     # Handle empty results
     if not stats_df:
@@ -331,10 +425,12 @@ def analyze_battle_defensive_profile(battle_id: int, db_path: Path | None = None
         }
 
     # Build Pokemon details
-    pokemon_details: list[dict[str, Any]] = []
+    pokemon_details: list[DefensiveDetail] = []
     physically_defensive_count = 0
     specially_defensive_count = 0
     balanced_count = 0
+    total_defense = 0
+    total_sp_defense = 0
 
     for row in stats_df:
         pokemon_key = row["pokemon_key"]
@@ -343,6 +439,8 @@ def analyze_battle_defensive_profile(battle_id: int, db_path: Path | None = None
         sp_defense = row["sp_defense"]
 
         profile = classify_pokemon_defensive_profile(defense, sp_defense)
+        total_defense += defense
+        total_sp_defense += sp_defense
 
         # Count profile types
         if profile == "Physically Defensive":
@@ -353,18 +451,18 @@ def analyze_battle_defensive_profile(battle_id: int, db_path: Path | None = None
             balanced_count += 1
 
         pokemon_details.append(
-            {
-                "pokemon_key": pokemon_key,
-                "slot": slot,
-                "defense": defense,
-                "sp_defense": sp_defense,
-                "profile": profile,
-            }
+            DefensiveDetail(
+                pokemon_key=pokemon_key,
+                slot=slot,
+                defense=defense,
+                sp_defense=sp_defense,
+                profile=profile,
+            )
         )
 
     # Calculate team averages
-    avg_team_defense = sum(r["defense"] for r in stats_df) / len(stats_df)
-    avg_team_sp_defense = sum(r["sp_defense"] for r in stats_df) / len(stats_df)
+    avg_team_defense = total_defense / len(stats_df)
+    avg_team_sp_defense = total_sp_defense / len(stats_df)
 
     # Determine recommendation
     # If they have more specially defensive Pokemon, use Physical moves
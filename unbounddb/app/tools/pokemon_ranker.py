@@ -34,17 +34,16 @@ def get_all_pokemon_with_stats(db_path: Path | None = None) -> list[dict[str, An
         List of dicts with keys:
         - pokemon_key, name, type1, type2, attack, sp_attack, defense, sp_defense, speed, bst
     """
-    conn = _get_conn(db_path)
+    with _get_conn(db_path) as conn:
+        query = """
+            SELECT pokemon_key, name, type1, type2,
+                   attack, sp_attack, defense, sp_defense, speed, bst
+            FROM pokemon
+            ORDER BY name
+        """
 
-    query = """
-        SELECT pokemon_key, name, type1, type2,
-               attack, sp_attack, defense, sp_defense, speed, bst
-        FROM pokemon
-        ORDER BY name
-    """
-
-    cursor = conn.execute(query)
-    result = fetchall_to_dicts(cursor)
+        cursor = conn.execute(query)
+        result = fetchall_to_dicts(cursor)
 
     return result
 
@@ -76,21 +75,20 @@ def get_all_learnable_offensive_moves(
         List of dicts with keys:
         - pokemon_key, move_key, move_name, move_type, category, power, learn_method, level
     """
-    conn = _get_conn(db_path)
-
-    query = """
-        SELECT pm.pokemon_key, pm.move_key, pm.learn_method, pm.level,
-               m.name AS move_name, m.type AS move_type, m.category, m.power
-        FROM pokemon_moves pm
-        JOIN moves m ON pm.move_key = m.move_key
-        WHERE m.power > 0
-          AND m.category IN ('Physical', 'Special')
-          AND pm.learn_method != 'tutor'
-        ORDER BY pm.pokemon_key, m.power DESC
-    """
-
-    cursor = conn.execute(query)
-    result = fetchall_to_dicts(cursor)
+    with _get_conn(db_path) as conn:
+        query = """
+            SELECT pm.pokemon_key, pm.move_key, pm.learn_method, pm.level,
+                   m.name AS move_name, m.type AS move_type, m.category, m.power
+            FROM pokemon_moves pm
+            JOIN moves m ON pm.move_key = m.move_key
+            WHERE m.power > 0
+              AND m.category IN ('Physical', 'Special')
+              AND pm.learn_method != 'tutor'
+            ORDER BY pm.pokemon_key, m.power DESC
+        """
+
+        cursor = conn.execute(query)
+        result = fetchall_to_dicts(cursor)
 
     # Filter out TM moves that aren't obtainable at current progression
     if available_tm_keys is not None and result:
@@ -642,9 +640,9 @@ def get_pokemon_moves_detail(
         - learn_method, level, type_rank
     """
     # Get Pokemon's types
-    conn = _get_conn(db_path)
-    query = "SELECT type1, type2 FROM pokemon WHERE pokemon_key = ?"
-    result = conn.execute(query, [pokemon_key]).fetchone()
+    with _get_conn(db_path) as conn:
+        query = "SELECT type1, type2 FROM pokemon WHERE pokemon_key = ?"
+        result = conn.execute(query, [pokemon_key]).fetchone()
 
     if not result:
         return []
@@ -45,6 +45,83 @@ def load_parquet_to_table(
     conn.commit()
 
 
+# Columns behind the app's DISTINCT dropdown catalogs and equality filters; a
+# covering index turns "SELECT DISTINCT col ... ORDER BY col" into an index walk
+# with no temp B-tree for the DISTINCT or the sort
+_CATEGORY_COLUMNS: dict[str, tuple[str, ...]] = {
+    "battles": ("difficulty",),
+    "pokemon": ("type1", "type2"),
+    "moves": ("type", "category", "name"),
+}
+
+
+def _create_category_indexes(conn: sqlite3.Connection, table_names: list[str]) -> None:
+    """Index catalog and category columns so DISTINCT and equality filters use index scans.
+
+    Args:
+        conn: SQLite connection with loaded tables.
+        table_names: Names of the tables present in the database.
+    """
+    for table_name, category_cols in _CATEGORY_COLUMNS.items():
+        if table_name not in table_names:
+            continue
+        columns = conn.execute(f"PRAGMA table_info('{table_name}')").fetchall()
+        col_names = [c[1] for c in columns]
+        for col in category_cols:
+            if col in col_names:
+                conn.execute(f"CREATE INDEX idx_{table_name}_{col} ON {table_name}({col})")
+
+
+# Case-insensitive name lookups: the app queries match these exact LOWER() expressions
+_LOWER_NAME_COLUMNS: dict[str, tuple[str, ...]] = {
+    "evolutions": ("from_pokemon", "to_pokemon"),
+    "locations": ("pokemon",),
+}
+
+
+def _create_lower_name_indexes(conn: sqlite3.Connection, table_names: list[str]) -> None:
+    """Create expression indexes on LOWER(name) for case-insensitive lookups and joins.
+
+    Args:
+        conn: SQLite connection with loaded tables.
+        table_names: Names of the tables present in the database.
+    """
+    for table_name, name_cols in _LOWER_NAME_COLUMNS.items():
+        if table_name not in table_names:
+            continue
+        columns = conn.execute(f"PRAGMA table_info('{table_name}')").fetchall()
+        col_names = [c[1] for c in columns]
+        for col in name_cols:
+            if col in col_names:
+                conn.execute(f"CREATE INDEX idx_{table_name}_{col}_lower ON {table_name}(LOWER({col}))")
+
+
+# Multi-column indexes for hot lookups: the move filter's semi-join reads
+# pokemon_key for every learner of one move_key without touching the table
+_COVERING_INDEXES: dict[str, tuple[tuple[str, ...], ...]] = {
+    "pokemon_moves": (("move_key", "pokemon_key"),),
+    # Battle team lookups filter on battle_id and ORDER BY slot, so this skips the sort
+    "battle_pokemon": (("battle_id", "slot"),),
+}
+
+
+def _create_covering_indexes(conn: sqlite3.Connection, table_names: list[str]) -> None:
+    """Create multi-column indexes so hot lookups skip table reads or sorts.
+
+    Args:
+        conn: SQLite connection with loaded tables.
+        table_names: Names of the tables present in the database.
+    """
+    for table_name, index_cols in _COVERING_INDEXES.items():
+        if table_name not in table_names:
+            continue
+        columns = conn.execute(f"PRAGMA table_info('{table_name}')").fetchall()
+        col_names = [c[1] for c in columns]
+        for cols in index_cols:
+            if all(col in col_names for col in cols):
+                conn.execute(f"CREATE INDEX idx_{table_name}_{'_'.join(cols)} ON {table_name}({', '.join(cols)})")
+
+
 def create_indexes(conn: sqlite3.Connection) -> None:
     """Create indexes on key columns for efficient joining.
 
@@ -88,14 +165,23 @@ def create_indexes(conn: sqlite3.Connection) -> None:
         if "learn_method" in col_names:
             conn.execute(f"CREATE INDEX idx_{table_name}_learn_method ON {table_name}(learn_method)")
 
+    _create_category_indexes(conn, table_names)
+    _create_lower_name_indexes(conn, table_names)
+    _create_covering_indexes(conn, table_names)
+
+    # No ANALYZE: sqlite_stat1 makes the planner scan all Pokemon before json_each
+    # move filters, which it cannot estimate, slowing move searches 3-5x
     conn.commit()
 
 
-def get_connection(db_path: Path) -> sqlite3.Connection:
+def get_connection(db_path: Path, read_only: bool = False) -> sqlite3.Connection:
     """Get a connection to an existing database.
 
     Args:
         db_path: Path to the database file.
+        read_only: If True, open with SQLite's ``mode=ro`` so the connection
+            takes no write locks and rejects any modification. Build steps
+            that write keep the default read-write connection.
 
     Returns:
         SQLite connection.
@@ -106,6 +192,9 @@ def get_connection(db_path: Path) -> sqlite3.Connection:
     if not db_path.exists():
         raise FileNotFoundError(f"Database not found: {db_path}")
 
+    if read_only:
+        return sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True)
+
     return sqlite3.connect(str(db_path))
 
 
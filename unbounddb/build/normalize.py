@@ -3,11 +3,17 @@ ABOUTME: Provides slugify function for creating join keys from names."""
 
 import re
 import unicodedata
+from functools import lru_cache
 
 
+# Pure function over a small vocabulary of Pokemon, move and location names that
+# parsers and UI lookups slugify over and over
+@lru_cache(maxsize=4096)
 def slugify(text: str) -> str:
     """Convert text to a normalized slug for use as a join key.
 
+    Results are memoized, so repeated names skip the regex passes.
+
     Handles:
     - Unicode normalization (accents, special chars)
     - Whitespace trimming and collapsing
@@ -28,6 +28,9 @@ class Settings(BaseSettings):
     PROJECT_ROOT: Path = _get_project_root()
     """Root directory of the project."""
 
+    DB_POOL_SIZE: int = 4
+    """Maximum idle read-only SQLite connections the app keeps per database file."""
+
     @computed_field  # type: ignore[prop-decorator]
     @property
     def project_root(self) -> Path:
@@ -3,6 +3,8 @@
 
 from unbounddb.utils.type_chart import (
     EFFECTIVENESS,
+    EFFECTIVENESS_TABLE,
+    TYPE_INDEX,
     TYPES,
     generate_all_type_combinations,
     get_effectiveness,
@@ -11,11 +13,14 @@ from unbounddb.utils.type_chart import (
     get_resistances,
     get_weaknesses,
     score_defensive_typing,
+    type_index,
 )
 
 __all__ = [
     "EFFECTIVENESS",
+    "EFFECTIVENESS_TABLE",
     "TYPES",
+    "TYPE_INDEX",
     "generate_all_type_combinations",
     "get_effectiveness",
     "get_immunities",
@@ -23,4 +28,5 @@ __all__ = [
     "get_resistances",
     "get_weaknesses",
     "score_defensive_typing",
+    "type_index",
 ]
@@ -419,6 +419,45 @@ def get_effectiveness(atk_type: str, def_type1: str, def_type2: str | None = Non
     return multiplier
 
 
+# Column of EFFECTIVENESS_TABLE used for a monotype's missing second type
+NO_TYPE_INDEX = len(TYPES)
+
+TYPE_INDEX: dict[str, int] = {type_name: index for index, type_name in enumerate(TYPES)}
+
+
+def _build_effectiveness_table() -> tuple[tuple[tuple[float, ...], ...], ...]:
+    """Precompute get_effectiveness for every (attacker, type1, type2) triple.
+
+    Returns:
+        Nested tuples indexed as [atk][def1][def2] using TYPE_INDEX positions,
+        with NO_TYPE_INDEX as def2 for monotypes.
+    """
+    second_types: list[str | None] = [*TYPES, None]
+    return tuple(
+        tuple(
+            tuple(get_effectiveness(atk_type, def_type1, def_type2) for def_type2 in second_types)
+            for def_type1 in TYPES
+        )
+        for atk_type in TYPES
+    )
+
+
+# 18x18x19 lookup of every multiplier, so hot loops can index by int instead of calling get_effectiveness
+EFFECTIVENESS_TABLE = _build_effectiveness_table()
+
+
+def type_index(type_name: str | None) -> int:
+    """Return the EFFECTIVENESS_TABLE position of a type.
+
+    Args:
+        type_name: A type from TYPES, or None for a monotype's second type.
+
+    Returns:
+        Index into EFFECTIVENESS_TABLE (NO_TYPE_INDEX for None).
+    """
+    return NO_TYPE_INDEX if type_name is None else TYPE_INDEX[type_name]
+
+
 def get_weaknesses(def_type1: str, def_type2: str | None = None) -> list[str]:
     """Return types that are super effective (>=2x) against the defender.
 
@@ -526,8 +565,11 @@ def score_defensive_typing(
     neutral: list[str] = []
     weaknesses: list[str] = []
 
+    def_index1 = TYPE_INDEX[def_type1]
+    def_index2 = type_index(def_type2)
+
     for atk_type in attacking_types:
-        effectiveness = get_effectiveness(atk_type, def_type1, def_type2)
+        effectiveness = EFFECTIVENESS_TABLE[TYPE_INDEX[atk_type]][def_index1][def_index2]
 
         if effectiveness == 0.0:
             immunities.append(atk_type)